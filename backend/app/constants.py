@@ -16,3 +16,10 @@ TIME_CATEGORY_COLORS: Dict[str, str] = {
 
 # Default color for unknown categories
 DEFAULT_COLOR = "#808080"
+
+# Decimal digits of coordinate precision kept when encoding geometry as TWKB
+# (6 digits is roughly 0.1 m at Dallas-Fort Worth latitudes)
+TWKB_PRECISION = 6
+
+# Media type for binary TWKB feature collections
+TWKB_MEDIA_TYPE = "application/vnd.twkb"
@@ -41,6 +41,12 @@ class DatabaseConfig(BaseModel):
         )
 
 
+# Endpoints are sync functions that FastAPI runs on AnyIO's worker threadpool
+# (40 threads by default), so the pool lets every worker hold a connection
+# instead of queueing behind a smaller pool.
+POOL_SIZE = 25
+MAX_OVERFLOW = 15
+
 # Global variables for database
 engine: Optional[Engine] = None
 session_maker: Optional[sessionmaker[Session]] = None
@@ -53,8 +59,8 @@ def init_database(config: DatabaseConfig) -> None:
     engine = create_engine(
         config.database_url,
         echo=False,  # Set to True for SQL debugging
-        pool_size=10,
-        max_overflow=20,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
         pool_pre_ping=True,
     )
 
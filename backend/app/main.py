@@ -1,13 +1,16 @@
 import logging
-from fastapi import FastAPI, HTTPException, Response, Request, Depends
+from fastapi import FastAPI, HTTPException, Response, Request, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from typing import cast, Any, NoReturn
+from typing import cast, Any, Dict, List, Literal, NoReturn
+from .constants import TWKB_MEDIA_TYPE
 from .database import DatabaseConfig, init_database, get_db_session
 from .logging_config import CorrelationIdMiddleware
 from .models import (
@@ -25,6 +28,7 @@ from .services import (
     IsochroneService,
     SchoolOfStudyService,
 )
+from .twkb import encode_twkb_features
 
 load_dotenv()
 
@@ -43,6 +47,19 @@ def handle_internal_error(error: Exception, context: str) -> NoReturn:
     raise HTTPException(status_code=500, detail=error_detail)
 
 
+# Geometry encodings offered by the spatial endpoints via ?format=
+SpatialFormat = Literal["geojson", "twkb"]
+
+
+def twkb_response(features: List[Dict[str, Any]]) -> Response:
+    """Build a binary response from features whose geometries are TWKB bytes."""
+    return Response(
+        content=encode_twkb_features(features),
+        media_type=TWKB_MEDIA_TYPE,
+        headers={"Content-Disposition": "inline"},
+    )
+
+
 limiter = Limiter(key_func=get_remote_address)
 app = FastAPI(
     title="Spatial Jobs Index API",
@@ -70,6 +87,7 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://github.com/Dallas-College-LMIC/spatial-jobs-index/blob/master/LICENSE",
     },
+    default_response_class=ORJSONResponse,
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, cast(Any, _rate_limit_exceeded_handler))  # type: ignore[arg-type]
@@ -91,6 +109,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger payloads (GeoJSON and TWKB collections) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Add correlation ID middleware
 app.add_middleware(BaseHTTPMiddleware, dispatch=CorrelationIdMiddleware().dispatch)
 
@@ -129,10 +150,15 @@ def get_occupation_ids(
 @app.get("/geojson")
 @limiter.limit("10/minute")
 def get_geojson(
-    request: Request, session: Session = Depends(get_db_session)
+    request: Request,
+    session: Session = Depends(get_db_session),
+    output_format: SpatialFormat = Query("geojson", alias="format"),
 ) -> Response:
     try:
         service = SpatialService(session)
+        if output_format == "twkb":
+            return twkb_response(service.get_twkb_features())
+
         features = service.get_geojson_features()
 
         geojson_collection = GeoJSONFeatureCollection(features=features)
@@ -149,12 +175,19 @@ def get_geojson(
 @app.get("/occupation_data/{category}")
 @limiter.limit("30/minute")
 def get_occupation_spatial_data(
-    category: str, request: Request, session: Session = Depends(get_db_session)
+    category: str,
+    request: Request,
+    session: Session = Depends(get_db_session),
+    output_format: SpatialFormat = Query("geojson", alias="format"),
 ) -> Response:
     """Get spatial data for a specific occupation category"""
     try:
         service = OccupationService(session)
-        features = service.get_occupation_spatial_data(category)
+        features: List[Any] = (
+            service.get_occupation_twkb_features(category)
+            if output_format == "twkb"
+            else service.get_occupation_spatial_data(category)
+        )
 
         if not features:
             raise HTTPException(
@@ -162,6 +195,9 @@ def get_occupation_spatial_data(
                 detail=f"No data found for occupation category: {category}",
             )
 
+        if output_format == "twkb":
+            return twkb_response(features)
+
         geojson_collection = OccupationGeoJSONFeatureCollection(features=features)
 
         return Response(
@@ -248,7 +284,10 @@ def get_school_of_study_ids(
 @app.get("/school_of_study_data/{category}", tags=["School of Study"])
 @limiter.limit("30/minute")
 def get_school_of_study_spatial_data(
-    category: str, request: Request, session: Session = Depends(get_db_session)
+    category: str,
+    request: Request,
+    session: Session = Depends(get_db_session),
+    output_format: SpatialFormat = Query("geojson", alias="format"),
 ) -> Response:
     """
     Get spatial GeoJSON data for a specific school of study category.
@@ -258,6 +297,7 @@ def get_school_of_study_spatial_data(
 
     ## Parameters
     * **category**: School of study category code (BHGT, CAED, CE, EDU, ETMS, HS, LPS, MIT)
+    * **format**: `geojson` (default) or `twkb` for a compact binary encoding
 
     ## Response Data
     * **Z-scores**: Standardized metrics for openings_2024_zscore and jobs_2024_zscore
@@ -270,17 +310,31 @@ def get_school_of_study_spatial_data(
     * `HS` - Health Services and medical programs
 
     ## Error Handling
-    Returns 404 if category is not found or has no associated spatial data.
+    Returns 404 if category is not found or has no associated spatial data, and
+    501 for `format=twkb` when the database does not support PostGIS.
     """
     try:
+        if output_format == "twkb" and not SchoolOfStudyService.supports_twkb():
+            raise HTTPException(
+                status_code=501,
+                detail="TWKB output requires a PostGIS database",
+            )
+
         service = SchoolOfStudyService(session)
-        features = service.get_school_spatial_data(category)
+        features: List[Any] = (
+            service.get_school_twkb_features(category)
+            if output_format == "twkb"
+            else service.get_school_spatial_data(category)
+        )
 
         if not features:
             raise HTTPException(
                 status_code=404, detail=f"No data found for school category: {category}"
             )
 
+        if output_format == "twkb":
+            return twkb_response(features)
+
         geojson_collection = SchoolOfStudyGeoJSONFeatureCollection(features=features)
 
         return Response(
@@ -3,7 +3,8 @@ from typing import Generic, TypeVar, Optional, List, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
-import json
+import orjson
+from ..constants import TWKB_PRECISION
 from ..logging_config import StructuredLogger
 
 T = TypeVar("T")
@@ -118,11 +119,27 @@ class BaseRepository(ABC, Generic[T]):
         """Convert PostGIS geometry to GeoJSON format"""
         try:
             geojson_str = self.session.scalar(func.ST_AsGeoJSON(geom_column))
-            return json.loads(geojson_str) if geojson_str else None
-        except (SQLAlchemyError, json.JSONDecodeError):
+            return orjson.loads(geojson_str) if geojson_str else None
+        except (SQLAlchemyError, orjson.JSONDecodeError):
             logger.error(
                 "Error converting geometry to GeoJSON",
                 exc_info=True,
                 extra={"operation": "get_geojson_geometry"},
             )
             return None
+
+    @staticmethod
+    def geometry_expression(geom_column: Any, as_twkb: bool = False) -> Any:
+        """Select a geometry as GeoJSON text, or as TWKB bytes when as_twkb is set"""
+        if as_twkb:
+            return func.ST_AsTWKB(geom_column, TWKB_PRECISION)
+        return func.ST_AsGeoJSON(geom_column)
+
+    @staticmethod
+    def decode_geometry(value: Any, as_twkb: bool = False) -> Optional[Any]:
+        """Decode a geometry selected through geometry_expression()"""
+        if not value:
+            return None
+        if as_twkb:
+            return bytes(value)
+        return orjson.loads(value)
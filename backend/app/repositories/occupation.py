@@ -1,7 +1,6 @@
 from typing import List, Dict
 from sqlalchemy import func, case, or_
 from sqlalchemy.orm import Session
-import json
 
 from .base import BaseRepository
 from ..models import OccupationLvlData, OccupationCode
@@ -39,34 +38,44 @@ class OccupationRepository(BaseRepository[OccupationLvlData]):
             .all()
         )
 
-        return [{"code": r.code, "name": r.name} for r in results]
+        return [{"code": code, "name": name} for code, name in results]
 
-    def get_spatial_data_by_category(self, category: str) -> List[Dict]:
-        """Get spatial data for a specific occupation category"""
+    def get_spatial_data_by_category(
+        self, category: str, as_twkb: bool = False
+    ) -> List[Dict]:
+        """
+        Get spatial data for a specific occupation category.
+
+        Args:
+            category: Occupation category code
+            as_twkb: Return geometries as TWKB bytes instead of GeoJSON dicts
+        """
         results = (
             self.session.query(
                 OccupationLvlData.geoid,
                 OccupationLvlData.openings_2024_zscore,
                 OccupationLvlData.jobs_2024_zscore,
                 OccupationLvlData.openings_2024_zscore_color,
-                func.ST_AsGeoJSON(OccupationLvlData.geom).label("geometry"),
+                self.geometry_expression(OccupationLvlData.geom, as_twkb).label(
+                    "geometry"
+                ),
             )
             .filter(OccupationLvlData.category == category)
             .all()
         )
 
         features = []
-        for row in results:
+        for geoid, openings_zscore, jobs_zscore, openings_color, geometry in results:
             features.append(
                 {
                     "type": "Feature",
-                    "geometry": json.loads(row.geometry) if row.geometry else None,
+                    "geometry": self.decode_geometry(geometry, as_twkb),
                     "properties": {
-                        "geoid": str(row.geoid) if row.geoid is not None else None,
+                        "geoid": str(geoid) if geoid is not None else None,
                         "category": category,
-                        "openings_2024_zscore": row.openings_2024_zscore,
-                        "jobs_2024_zscore": row.jobs_2024_zscore,
-                        "openings_2024_zscore_color": row.openings_2024_zscore_color,
+                        "openings_2024_zscore": openings_zscore,
+                        "jobs_2024_zscore": jobs_zscore,
+                        "openings_2024_zscore_color": openings_color,
                     },
                 }
             )
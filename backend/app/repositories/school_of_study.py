@@ -1,8 +1,8 @@
 from typing import List, Dict
-from sqlalchemy import func, distinct, cast, String
+from sqlalchemy import distinct, cast, String
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-import json
+import orjson
 from ..logging_config import StructuredLogger
 
 from .base import BaseRepository
@@ -30,7 +30,7 @@ class SchoolOfStudyRepository(BaseRepository[SchoolOfLvlData]):
                 .all()
             )
 
-            return [{"code": r[0]} for r in results]
+            return [{"code": code} for (code,) in results]
         except SQLAlchemyError as e:
             self.logger.error(
                 "Database error in get_school_of_study_categories",
@@ -38,8 +38,17 @@ class SchoolOfStudyRepository(BaseRepository[SchoolOfLvlData]):
             )
             raise
 
-    def get_spatial_data_by_category(self, category: str) -> List[Dict]:
-        """Get spatial data for a specific school of study category"""
+    def get_spatial_data_by_category(
+        self, category: str, as_twkb: bool = False
+    ) -> List[Dict]:
+        """
+        Get spatial data for a specific school of study category.
+
+        Args:
+            category: School of study category code
+            as_twkb: Return geometries as TWKB bytes instead of GeoJSON dicts.
+                Requires PostGIS.
+        """
         try:
             # Use configuration to determine database capabilities
             supports_postgis = DatabaseConfig.supports_postgis()
@@ -52,11 +61,16 @@ class SchoolOfStudyRepository(BaseRepository[SchoolOfLvlData]):
                         SchoolOfLvlData.openings_2024_zscore,
                         SchoolOfLvlData.jobs_2024_zscore,
                         SchoolOfLvlData.openings_2024_zscore_color,
-                        func.ST_AsGeoJSON(SchoolOfLvlData.geom).label("geometry"),
+                        self.geometry_expression(SchoolOfLvlData.geom, as_twkb).label(
+                            "geometry"
+                        ),
                     )
                     .filter(SchoolOfLvlData.category == category)
                     .all()
                 )
+            elif as_twkb:
+                # Callers check SchoolOfStudyService.supports_twkb() first
+                raise ValueError("TWKB geometry output requires PostGIS")
             else:
                 # For SQLite testing, geometry is stored as text
                 results = (
@@ -72,17 +86,23 @@ class SchoolOfStudyRepository(BaseRepository[SchoolOfLvlData]):
                 )
 
             features = []
-            for row in results:
-                # Handle geometry parsing - both environments return JSON strings
+            for (
+                geoid,
+                openings_zscore,
+                jobs_zscore,
+                openings_color,
+                geometry,
+            ) in results:
+                geoid_str = str(int(float(geoid))) if geoid is not None else None
+
+                # Handle geometry parsing - JSON strings, or TWKB bytes on request
                 try:
-                    geometry = json.loads(row.geometry) if row.geometry else None
-                except (json.JSONDecodeError, TypeError) as e:
+                    geometry = self.decode_geometry(geometry, as_twkb)
+                except (orjson.JSONDecodeError, TypeError) as e:
                     self.logger.info(
                         "Failed to parse geometry for geoid",
                         extra={
-                            "geoid": str(int(float(row.geoid)))
-                            if row.geoid is not None
-                            else None,
+                            "geoid": geoid_str,
                             "error": str(e),
                             "method": "get_spatial_data_by_category",
                             "level": "warning",
@@ -95,13 +115,11 @@ class SchoolOfStudyRepository(BaseRepository[SchoolOfLvlData]):
                         "type": "Feature",
                         "geometry": geometry,
                         "properties": {
-                            "geoid": str(int(float(row.geoid)))
-                            if row.geoid is not None
-                            else None,
+                            "geoid": geoid_str,
                             "category": category,
-                            "openings_2024_zscore": row.openings_2024_zscore,
-                            "jobs_2024_zscore": row.jobs_2024_zscore,
-                            "openings_2024_zscore_color": row.openings_2024_zscore_color,
+                            "openings_2024_zscore": openings_zscore,
+                            "jobs_2024_zscore": jobs_zscore,
+                            "openings_2024_zscore_color": openings_color,
                         },
                     }
                 )
@@ -1,6 +1,6 @@
 from typing import List, Dict
 from sqlalchemy import func, text
-import json
+import orjson
 
 from .base import BaseRepository
 from ..models import TTIClone
@@ -51,28 +51,32 @@ class TravelTimeRepository(BaseRepository[TTIClone]):
             func.ST_AsGeoJSON(TTIClone.geom).label("geometry"),
         ).all()
 
+        zscore_key = f"{wage_type}_zscore"
+        zscore_cat_key = f"{wage_type}_zscore_cat"
+
         features = []
-        for row in results:
+        for geoid, zscore, zscore_cat, geometry in results:
             features.append(
                 {
                     "type": "Feature",
-                    "geometry": json.loads(row.geometry) if row.geometry else None,
+                    "geometry": orjson.loads(geometry) if geometry else None,
                     "properties": {
-                        "geoid": str(int(float(row.geoid)))
-                        if row.geoid is not None
-                        else None,
-                        f"{wage_type}_zscore": row.zscore,
-                        f"{wage_type}_zscore_cat": row.zscore_cat,
+                        "geoid": str(int(float(geoid))) if geoid is not None else None,
+                        zscore_key: zscore,
+                        zscore_cat_key: zscore_cat,
                     },
                 }
             )
 
         return features
 
-    def get_all_wage_data(self) -> List[Dict]:
+    def get_all_wage_data(self, as_twkb: bool = False) -> List[Dict]:
         """
         Get all wage level data (all_jobs, living_wage, not_living_wage) for all census tracts.
 
+        Args:
+            as_twkb: Return geometries as TWKB bytes instead of GeoJSON dicts
+
         Returns:
             List of GeoJSON features with all wage data
         """
@@ -84,25 +88,32 @@ class TravelTimeRepository(BaseRepository[TTIClone]):
             TTIClone.living_wage_zscore_cat,
             TTIClone.not_living_wage_zscore,
             TTIClone.not_living_wage_zscore_cat,
-            func.ST_AsGeoJSON(TTIClone.geom).label("geometry"),
+            self.geometry_expression(TTIClone.geom, as_twkb).label("geometry"),
         ).all()
 
         features = []
-        for row in results:
+        for (
+            geoid,
+            all_jobs_zscore,
+            all_jobs_zscore_cat,
+            living_wage_zscore,
+            living_wage_zscore_cat,
+            not_living_wage_zscore,
+            not_living_wage_zscore_cat,
+            geometry,
+        ) in results:
             features.append(
                 {
                     "type": "Feature",
-                    "geometry": json.loads(row.geometry) if row.geometry else None,
+                    "geometry": self.decode_geometry(geometry, as_twkb),
                     "properties": {
-                        "geoid": str(int(float(row.geoid)))
-                        if row.geoid is not None
-                        else None,
-                        "all_jobs_zscore": row.all_jobs_zscore,
-                        "all_jobs_zscore_cat": row.all_jobs_zscore_cat,
-                        "living_wage_zscore": row.living_wage_zscore,
-                        "living_wage_zscore_cat": row.living_wage_zscore_cat,
-                        "not_living_wage_zscore": row.not_living_wage_zscore,
-                        "not_living_wage_zscore_cat": row.not_living_wage_zscore_cat,
+                        "geoid": str(int(float(geoid))) if geoid is not None else None,
+                        "all_jobs_zscore": all_jobs_zscore,
+                        "all_jobs_zscore_cat": all_jobs_zscore_cat,
+                        "living_wage_zscore": living_wage_zscore,
+                        "living_wage_zscore_cat": living_wage_zscore_cat,
+                        "not_living_wage_zscore": not_living_wage_zscore,
+                        "not_living_wage_zscore_cat": not_living_wage_zscore_cat,
                     },
                 }
             )
@@ -144,16 +155,15 @@ class TravelTimeRepository(BaseRepository[TTIClone]):
         result = self.session.execute(query, {"geoid": geoid})
         features = []
 
-        for row in result.fetchall():
-            time_category = row.traveltime_category
+        for row_geoid, time_category, geometry in result:
             color = TIME_CATEGORY_COLORS.get(time_category, DEFAULT_COLOR)
 
             features.append(
                 {
                     "type": "Feature",
-                    "geometry": json.loads(row.geometry),
+                    "geometry": orjson.loads(geometry),
                     "properties": {
-                        "geoid": str(row.geoid),
+                        "geoid": str(row_geoid),
                         "time_category": time_category,
                         "color": color,
                     },
@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Type, TypeVar
 import os
 import logging
 
+from pydantic import BaseModel
+
+from .config import DatabaseConfig
 from .constants import TIME_CATEGORY_COLORS
 from .models import (
     SpatialFeatureProperties,
@@ -22,6 +26,23 @@ from .repositories import (
 
 logger = logging.getLogger(__name__)
 
+FeatureT = TypeVar("FeatureT", bound=BaseModel)
+
+
+def build_features(
+    features_data: List[Dict[str, Any]],
+    feature_cls: Type[FeatureT],
+    properties_cls: Type[BaseModel],
+) -> List[FeatureT]:
+    """Convert repository feature dicts into Pydantic GeoJSON feature models"""
+    return [
+        feature_cls(
+            geometry=feature_dict["geometry"],
+            properties=properties_cls(**feature_dict["properties"]),
+        )
+        for feature_dict in features_data
+    ]
+
 
 class OccupationService:
     """Service for occupation-related operations"""
@@ -66,19 +87,15 @@ class OccupationService:
         self, category: str
     ) -> List[OccupationGeoJSONFeature]:
         """Get spatial data for a specific occupation category as GeoJSON features"""
-        # Get features from repository
-        features_data = self.repository.get_spatial_data_by_category(category)
+        return build_features(
+            self.repository.get_spatial_data_by_category(category),
+            OccupationGeoJSONFeature,
+            OccupationSpatialProperties,
+        )
 
-        # Convert to Pydantic models
-        features = []
-        for feature_dict in features_data:
-            properties = OccupationSpatialProperties(**feature_dict["properties"])
-            feature = OccupationGeoJSONFeature(
-                geometry=feature_dict["geometry"], properties=properties
-            )
-            features.append(feature)
-
-        return features
+    def get_occupation_twkb_features(self, category: str) -> List[Dict[str, Any]]:
+        """Get spatial data for a specific occupation category with TWKB geometries"""
+        return self.repository.get_spatial_data_by_category(category, as_twkb=True)
 
 
 class SpatialService:
@@ -90,19 +107,15 @@ class SpatialService:
 
     def get_geojson_features(self) -> List[GeoJSONFeature]:
         """Get all spatial data as GeoJSON features"""
-        # Get all wage data from repository
-        features_data = self.repository.get_all_wage_data()
-
-        # Convert to Pydantic models
-        features = []
-        for feature_dict in features_data:
-            properties = SpatialFeatureProperties(**feature_dict["properties"])
-            feature = GeoJSONFeature(
-                geometry=feature_dict["geometry"], properties=properties
-            )
-            features.append(feature)
+        return build_features(
+            self.repository.get_all_wage_data(),
+            GeoJSONFeature,
+            SpatialFeatureProperties,
+        )
 
-        return features
+    def get_twkb_features(self) -> List[Dict[str, Any]]:
+        """Get all spatial data with TWKB geometries"""
+        return self.repository.get_all_wage_data(as_twkb=True)
 
 
 class SchoolOfStudyService:
@@ -120,6 +133,9 @@ class SchoolOfStudyService:
         "MIT": "Management & Information Technology",
     }
 
+    # Read-only view handed out to callers so the mapping never needs copying
+    _SCHOOL_NAMES_VIEW: Mapping[str, str] = MappingProxyType(SCHOOL_NAME_MAPPINGS)
+
     def __init__(self, session: Session):
         self.repository = SchoolOfStudyRepository(session)
         self.session = session
@@ -130,53 +146,51 @@ class SchoolOfStudyService:
         return [cat["code"] for cat in categories]
 
     @classmethod
-    def get_school_name_mappings(cls) -> Dict[str, str]:
-        """Get the mapping of school category codes to full names"""
-        return cls.SCHOOL_NAME_MAPPINGS.copy()
+    def get_school_name_mappings(cls) -> Mapping[str, str]:
+        """Get a read-only mapping of school category codes to full names"""
+        return cls._SCHOOL_NAMES_VIEW
 
     def get_school_spatial_data(
         self, category: str
     ) -> List[SchoolOfStudyGeoJSONFeature]:
         """Get spatial data for a specific school category as GeoJSON features"""
-        # Get features from repository
-        features_data = self.repository.get_spatial_data_by_category(category)
+        return build_features(
+            self.repository.get_spatial_data_by_category(category),
+            SchoolOfStudyGeoJSONFeature,
+            SchoolOfStudySpatialProperties,
+        )
 
-        # Convert to Pydantic models
-        features = []
-        for feature_dict in features_data:
-            properties = SchoolOfStudySpatialProperties(**feature_dict["properties"])
-            feature = SchoolOfStudyGeoJSONFeature(
-                geometry=feature_dict["geometry"], properties=properties
-            )
-            features.append(feature)
+    @staticmethod
+    def supports_twkb() -> bool:
+        """Check whether the database can encode school geometries as TWKB"""
+        return DatabaseConfig.supports_postgis()
 
-        return features
+    def get_school_twkb_features(self, category: str) -> List[Dict[str, Any]]:
+        """Get spatial data for a specific school category with TWKB geometries"""
+        return self.repository.get_spatial_data_by_category(category, as_twkb=True)
 
 
 class IsochroneService:
     """Service for isochrone travel time operations"""
 
+    # Read-only view handed out to callers so the mapping never needs copying
+    _TIME_CATEGORY_COLORS_VIEW: Mapping[str, str] = MappingProxyType(
+        TIME_CATEGORY_COLORS
+    )
+
     def __init__(self, session: Session):
         self.repository = TravelTimeRepository(session)
         self.session = session
 
     @classmethod
-    def get_time_category_colors(cls) -> Dict[str, str]:
-        """Get the mapping of time categories to colors"""
-        return TIME_CATEGORY_COLORS.copy()
+    def get_time_category_colors(cls) -> Mapping[str, str]:
+        """Get a read-only mapping of time categories to colors"""
+        return cls._TIME_CATEGORY_COLORS_VIEW
 
     def get_isochrones_by_geoid(self, geoid: str) -> List[IsochroneFeature]:
         """Get all isochrone bands for a specific census tract"""
-        # Get isochrone data from repository
-        features_data = self.repository.get_isochrones_by_geoid(geoid)
-
-        # Convert to Pydantic models
-        features = []
-        for feature_dict in features_data:
-            properties = IsochroneProperties(**feature_dict["properties"])
-            feature = IsochroneFeature(
-                geometry=feature_dict["geometry"], properties=properties
-            )
-            features.append(feature)
-
-        return features
+        return build_features(
+            self.repository.get_isochrones_by_geoid(geoid),
+            IsochroneFeature,
+            IsochroneProperties,
+        )
@@ -0,0 +1,52 @@
+"""Binary transport encoding for spatial feature collections using TWKB."""
+
+import struct
+from typing import Any, Dict, List
+
+import orjson
+
+_LENGTH = struct.Struct(">I")
+
+
+def encode_twkb_features(features: List[Dict[str, Any]]) -> bytes:
+    """
+    Pack repository features with TWKB geometries into a single binary payload.
+
+    Layout (every length is an unsigned 32-bit big-endian integer):
+        - header length, then a JSON array holding each feature's properties
+        - for each feature in the same order, the geometry length followed by
+          its TWKB bytes (a length of 0 marks a missing geometry)
+    """
+    header = orjson.dumps([feature["properties"] for feature in features])
+    parts = [_LENGTH.pack(len(header)), header]
+
+    for feature in features:
+        geometry = feature["geometry"] or b""
+        parts.append(_LENGTH.pack(len(geometry)))
+        parts.append(geometry)
+
+    return b"".join(parts)
+
+
+def decode_twkb_features(payload: bytes) -> List[Dict[str, Any]]:
+    """Unpack a payload produced by encode_twkb_features"""
+    (header_length,) = _LENGTH.unpack_from(payload, 0)
+    offset = _LENGTH.size
+    properties = orjson.loads(payload[offset : offset + header_length])
+    offset += header_length
+
+    features = []
+    for feature_properties in properties:
+        (geometry_length,) = _LENGTH.unpack_from(payload, offset)
+        offset += _LENGTH.size
+        geometry = payload[offset : offset + geometry_length] or None
+        offset += geometry_length
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": geometry,
+                "properties": feature_properties,
+            }
+        )
+
+    return features
@@ -4,22 +4,42 @@ Global pytest fixtures for spatial-index-api tests.
 This module contains fixtures that are available to all test modules.
 """
 
+import json
+import logging
 import os
 import pytest
-from typing import Generator, Dict, Any
-from unittest.mock import patch, MagicMock
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
-from fastapi.testclient import TestClient
-from httpx import AsyncClient, ASGITransport
+from contextlib import contextmanager
+from functools import lru_cache
+from io import StringIO
+from types import MappingProxyType, SimpleNamespace, TracebackType
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Generator,
+    Any,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+)
+from unittest.mock import patch
 
 # Set testing environment BEFORE importing app modules
 os.environ["TESTING"] = "1"
 os.environ["SQL_ECHO"] = "false"
 
-from app.database import DatabaseConfig, get_db_session
-from app.main import app
+# SQLAlchemy, httpx and the FastAPI app are imported inside the fixtures that
+# need them, so collecting tests that only use data fixtures stays cheap
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from httpx import AsyncClient
+    from sqlalchemy.orm import Session
+
+    from app.database import DatabaseConfig
 
 
 # Test database configuration
@@ -31,6 +51,155 @@ TEST_DB_CONFIG = {
 }
 
 
+# Connection settings for the SQLite test database: skip journaling and fsync
+# work that test data never needs, and enable foreign key support.
+_SQLITE_PRAGMAS = """
+PRAGMA journal_mode=MEMORY;
+PRAGMA synchronous=OFF;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA foreign_keys=ON;
+"""
+
+# Schema for the SQLite test database. Tables are created without a schema
+# since SQLite doesn't support schemas. Run as one script so SQLite parses and
+# applies everything in a single pass.
+_SCHEMA_SQL = """
+-- Create occupation_lvl_data table
+CREATE TABLE IF NOT EXISTS occupation_lvl_data (
+    geoid VARCHAR NOT NULL,
+    category VARCHAR NOT NULL,
+    openings_2024_zscore FLOAT,
+    jobs_2024_zscore FLOAT,
+    openings_2024_zscore_color VARCHAR,
+    geom TEXT,
+    PRIMARY KEY (geoid, category)
+);
+
+-- Create tti_clone table (geometry stored as text for SQLite)
+CREATE TABLE IF NOT EXISTS tti_clone (
+    geoid VARCHAR NOT NULL PRIMARY KEY,
+    all_jobs_zscore FLOAT,
+    all_jobs_zscore_cat VARCHAR,
+    living_wage_zscore FLOAT,
+    living_wage_zscore_cat VARCHAR,
+    not_living_wage_zscore FLOAT,
+    not_living_wage_zscore_cat VARCHAR,
+    geom TEXT
+);
+
+-- Create occupation_codes table
+CREATE TABLE IF NOT EXISTS occupation_codes (
+    occupation_code VARCHAR NOT NULL PRIMARY KEY,
+    occupation_name VARCHAR
+);
+
+-- Create school_of_lvl_data table
+CREATE TABLE IF NOT EXISTS school_of_lvl_data (
+    geoid VARCHAR NOT NULL,
+    category VARCHAR NOT NULL,
+    openings_2024_zscore FLOAT,
+    jobs_2024_zscore FLOAT,
+    openings_2024_zscore_color VARCHAR,
+    geom TEXT,
+    PRIMARY KEY (geoid, category)
+);
+
+-- Create school_of_study_codes table
+CREATE TABLE IF NOT EXISTS school_of_study_codes (
+    school_code VARCHAR NOT NULL PRIMARY KEY,
+    school_name VARCHAR
+);
+"""
+
+
+# Seed rows for the SQLite test database
+SEED_OCCUPATION_CODES = (
+    ("11-1021", "General and Operations Managers"),
+    ("15-1252", "Software Developers"),
+    ("29-1141", "Registered Nurses"),
+    ("33-3051", "Police and Sheriff's Patrol Officers"),
+    ("41-2031", "Retail Salespersons"),
+    ("49-3023", "Automotive Service Technicians and Mechanics"),
+    ("51-3091", "Food Servers, Nonrestaurant"),
+    ("53-3032", "Heavy and Tractor-Trailer Truck Drivers"),
+    ("99-9999", "All Other Occupations"),
+)
+
+SEED_SCHOOL_OF_STUDY_CODES = (
+    ("BHGT", "Biological and Biomedical Sciences"),
+    ("CAED", "Computer and Information Sciences"),
+    ("CE", "Engineering"),
+    ("EDU", "Education"),
+    ("ETMS", "Engineering Technologies"),
+    ("HS", "Health Sciences"),
+    ("LPS", "Legal Professions and Studies"),
+    ("MIT", "Multi/Interdisciplinary Studies"),
+)
+
+# Canonical sample geometries. The dicts feed the mock payloads below and
+# the compact JSON strings are bound into the seed inserts.
+_DALLAS_POINT = {"type": "Point", "coordinates": [-96.7970, 32.7767]}
+_KAUFMAN_POINT = {"type": "Point", "coordinates": [-96.3838, 32.7399]}
+_DALLAS_POINT_JSON = json.dumps(_DALLAS_POINT, separators=(",", ":"))
+_KAUFMAN_POINT_JSON = json.dumps(_KAUFMAN_POINT, separators=(",", ":"))
+
+SEED_OCCUPATION_LVL_DATA = (
+    ("48257050209", "51-3091", -0.0956, 0.0187, "-0.5SD ~ +0.5SD", _DALLAS_POINT_JSON),
+    (
+        "48257050213",
+        "51-3091",
+        -0.2926,
+        -0.2762,
+        "-0.5SD ~ +0.5SD",
+        _KAUFMAN_POINT_JSON,
+    ),
+    ("12345", "11-1021", 1.5, 1.2, "High", _DALLAS_POINT_JSON),
+)
+
+SEED_SCHOOL_OF_LVL_DATA = (
+    ("12345", "BHGT", 1.5, 1.2, "High", _DALLAS_POINT_JSON),
+    ("67890", "CAED", 0.8, 0.9, "Medium", _KAUFMAN_POINT_JSON),
+)
+
+SEED_TTI_CLONE = (
+    ("12345", 1.5, "High", 0.8, "Medium", -0.5, "Low", _DALLAS_POINT_JSON),
+    ("67890", 0.2, "Medium", 0.1, "Medium", 0.3, "Medium", _KAUFMAN_POINT_JSON),
+)
+
+# One prepared statement per table, executed once per seed row
+_SEED_INSERTS = (
+    (
+        "INSERT OR IGNORE INTO occupation_codes (occupation_code, occupation_name) "
+        "VALUES (?, ?)",
+        SEED_OCCUPATION_CODES,
+    ),
+    (
+        "INSERT OR IGNORE INTO school_of_study_codes (school_code, school_name) "
+        "VALUES (?, ?)",
+        SEED_SCHOOL_OF_STUDY_CODES,
+    ),
+    (
+        "INSERT OR IGNORE INTO occupation_lvl_data (geoid, category, "
+        "openings_2024_zscore, jobs_2024_zscore, openings_2024_zscore_color, geom) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        SEED_OCCUPATION_LVL_DATA,
+    ),
+    (
+        "INSERT OR IGNORE INTO school_of_lvl_data (geoid, category, "
+        "openings_2024_zscore, jobs_2024_zscore, openings_2024_zscore_color, geom) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        SEED_SCHOOL_OF_LVL_DATA,
+    ),
+    (
+        "INSERT OR IGNORE INTO tti_clone (geoid, all_jobs_zscore, all_jobs_zscore_cat, "
+        "living_wage_zscore, living_wage_zscore_cat, not_living_wage_zscore, "
+        "not_living_wage_zscore_cat, geom) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        SEED_TTI_CLONE,
+    ),
+)
+
+
 @pytest.fixture(scope="session")
 def mock_env_vars():
     """Mock environment variables for testing."""
@@ -38,14 +207,26 @@ def mock_env_vars():
         yield TEST_DB_CONFIG
 
 
+@lru_cache(maxsize=None)
+def _db_config(
+    username: str, password: str, url: str, database: str
+) -> "DatabaseConfig":
+    """Build a DatabaseConfig once per distinct set of connection settings."""
+    from app.database import DatabaseConfig
+
+    return DatabaseConfig(
+        username=username, password=password, url=url, database=database
+    )
+
+
 @pytest.fixture(scope="session")
-def test_db_config(mock_env_vars) -> DatabaseConfig:
+def test_db_config(mock_env_vars) -> "DatabaseConfig":
     """Create test database configuration."""
-    return DatabaseConfig(
-        username=TEST_DB_CONFIG["USERNAME"],
-        password=TEST_DB_CONFIG["PASS"],
-        url=TEST_DB_CONFIG["URL"],
-        database=TEST_DB_CONFIG["DB"],
+    return _db_config(
+        TEST_DB_CONFIG["USERNAME"],
+        TEST_DB_CONFIG["PASS"],
+        TEST_DB_CONFIG["URL"],
+        TEST_DB_CONFIG["DB"],
     )
 
 
@@ -56,176 +237,83 @@ def test_engine():
 
     This provides fast, isolated testing without requiring a real PostgreSQL instance.
     """
-    # Use SQLite for testing with proper configuration
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import QueuePool
+
+    # Use a named shared-cache in-memory database so pooled connections all
+    # see the same data instead of each getting a private :memory: database
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite:///file:testdb?mode=memory&cache=shared&uri=true",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        poolclass=QueuePool,
         echo=False,
     )
 
-    # Enable foreign key support in SQLite
-    with engine.connect() as conn:
-        conn.execute(text("PRAGMA foreign_keys=ON"))
-        conn.commit()
-
-    # Create tables manually without schema since SQLite doesn't support schemas
-    with engine.connect() as conn:
-        # Create occupation_lvl_data table
-        conn.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS occupation_lvl_data (
-                geoid VARCHAR NOT NULL,
-                category VARCHAR NOT NULL,
-                openings_2024_zscore FLOAT,
-                jobs_2024_zscore FLOAT,
-                openings_2024_zscore_color VARCHAR,
-                geom TEXT,
-                PRIMARY KEY (geoid, category)
-            )
-        """)
-        )
-
-        # Create tti_clone table (without geometry for SQLite)
-        conn.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS tti_clone (
-                geoid VARCHAR NOT NULL PRIMARY KEY,
-                all_jobs_zscore FLOAT,
-                all_jobs_zscore_cat VARCHAR,
-                living_wage_zscore FLOAT,
-                living_wage_zscore_cat VARCHAR,
-                not_living_wage_zscore FLOAT,
-                not_living_wage_zscore_cat VARCHAR,
-                geom TEXT
-            )
-        """)
-        )
-
-        # Create occupation_codes table
-        conn.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS occupation_codes (
-                occupation_code VARCHAR NOT NULL PRIMARY KEY,
-                occupation_name VARCHAR
-            )
-        """)
-        )
-
-        # Create school_of_lvl_data table
-        conn.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS school_of_lvl_data (
-                geoid VARCHAR NOT NULL,
-                category VARCHAR NOT NULL,
-                openings_2024_zscore FLOAT,
-                jobs_2024_zscore FLOAT,
-                openings_2024_zscore_color VARCHAR,
-                geom TEXT,
-                PRIMARY KEY (geoid, category)
-            )
-        """)
-        )
-
-        # Create school_of_study_codes table
-        conn.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS school_of_study_codes (
-                school_code VARCHAR NOT NULL PRIMARY KEY,
-                school_name VARCHAR
-            )
-        """)
-        )
-
-        # Insert sample data for testing
-
-        # Sample occupation codes data
-        conn.execute(
-            text("""
-            INSERT OR IGNORE INTO occupation_codes (occupation_code, occupation_name) VALUES
-            ('11-1021', 'General and Operations Managers'),
-            ('15-1252', 'Software Developers'),
-            ('29-1141', 'Registered Nurses'),
-            ('33-3051', 'Police and Sheriff''s Patrol Officers'),
-            ('41-2031', 'Retail Salespersons'),
-            ('49-3023', 'Automotive Service Technicians and Mechanics'),
-            ('51-3091', 'Food Servers, Nonrestaurant'),
-            ('53-3032', 'Heavy and Tractor-Trailer Truck Drivers'),
-            ('99-9999', 'All Other Occupations')
-        """)
-        )
-
-        # Sample school of study codes data
-        conn.execute(
-            text("""
-            INSERT OR IGNORE INTO school_of_study_codes (school_code, school_name) VALUES
-            ('BHGT', 'Biological and Biomedical Sciences'),
-            ('CAED', 'Computer and Information Sciences'),
-            ('CE', 'Engineering'),
-            ('EDU', 'Education'),
-            ('ETMS', 'Engineering Technologies'),
-            ('HS', 'Health Sciences'),
-            ('LPS', 'Legal Professions and Studies'),
-            ('MIT', 'Multi/Interdisciplinary Studies')
-        """)
-        )
-
-        # Sample occupation level data
-        conn.execute(
-            text("""
-            INSERT OR IGNORE INTO occupation_lvl_data (geoid, category, openings_2024_zscore, jobs_2024_zscore, openings_2024_zscore_color, geom) VALUES
-            ('48257050209', '51-3091', -0.0956, 0.0187, '-0.5SD ~ +0.5SD', '{"type":"Point","coordinates":[-96.7970,32.7767]}'),
-            ('48257050213', '51-3091', -0.2926, -0.2762, '-0.5SD ~ +0.5SD', '{"type":"Point","coordinates":[-96.3838,32.7399]}'),
-            ('12345', '11-1021', 1.5, 1.2, 'High', '{"type":"Point","coordinates":[-96.7970,32.7767]}')
-        """)
-        )
-
-        # Sample school level data
-        conn.execute(
-            text("""
-            INSERT OR IGNORE INTO school_of_lvl_data (geoid, category, openings_2024_zscore, jobs_2024_zscore, openings_2024_zscore_color, geom) VALUES
-            ('12345', 'BHGT', 1.5, 1.2, 'High', '{"type":"Point","coordinates":[-96.7970,32.7767]}'),
-            ('67890', 'CAED', 0.8, 0.9, 'Medium', '{"type":"Point","coordinates":[-96.3838,32.7399]}')
-        """)
-        )
-
-        # Sample TTI data
-        conn.execute(
-            text("""
-            INSERT OR IGNORE INTO tti_clone (geoid, all_jobs_zscore, all_jobs_zscore_cat, living_wage_zscore, living_wage_zscore_cat, not_living_wage_zscore, not_living_wage_zscore_cat, geom) VALUES
-            ('12345', 1.5, 'High', 0.8, 'Medium', -0.5, 'Low', '{"type":"Point","coordinates":[-96.7970,32.7767]}'),
-            ('67890', 0.2, 'Medium', 0.1, 'Medium', 0.3, 'Medium', '{"type":"Point","coordinates":[-96.3838,32.7399]}')
-        """)
-        )
-
-        conn.commit()
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        dbapi_connection.executescript(_SQLITE_PRAGMAS)
+
+    # The shared in-memory database lives only while a connection is open,
+    # so hold one for the whole session
+    keepalive = engine.connect()
+
+    # Create tables and insert sample data for testing
+    raw = engine.raw_connection()
+    try:
+        raw.executescript(_SCHEMA_SQL)
+        for statement, rows in _SEED_INSERTS:
+            raw.executemany(statement, rows)
+        raw.commit()
+    finally:
+        raw.close()
 
     yield engine
 
     # Cleanup
+    keepalive.close()
     engine.dispose()
 
 
+@pytest.fixture(scope="session")
+def _connection(test_engine):
+    """
+    Open one database connection for the whole test session.
+
+    Tests never commit this connection's outer transaction; each test runs
+    inside its own SAVEPOINT (see test_session) that is rolled back afterwards.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
 @pytest.fixture(scope="function")
-def test_session(test_engine) -> Generator[Session, None, None]:
+def test_session(_connection) -> Generator["Session", None, None]:
     """
     Create a test database session for each test function.
 
-    This fixture provides database isolation between tests using transactions.
+    The session joins the shared connection through a SAVEPOINT, so commits
+    made by a test only release nested savepoints and are undone when the
+    per-test savepoint is rolled back.
     """
-    TestSessionLocal = sessionmaker(bind=test_engine, expire_on_commit=False)
+    from sqlalchemy.orm import Session
 
-    # Start a transaction
-    connection = test_engine.connect()
-    transaction = connection.begin()
-    session = TestSessionLocal(bind=connection)
+    savepoint = _connection.begin_nested()
+    session = Session(
+        bind=_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     yield session
 
-    # Rollback the transaction to ensure test isolation
+    # Roll back everything the test wrote to keep tests isolated
     session.close()
-    transaction.rollback()
-    connection.close()
+    savepoint.rollback()
 
 
 @pytest.fixture(scope="function")
@@ -234,52 +322,111 @@ def mock_db_session(test_session):
     Override the get_db_session dependency with test session.
 
     This fixture patches the FastAPI dependency to use our test database.
+    The override is a plain coroutine rather than a sync generator, so
+    FastAPI resolves it on the event loop instead of wrapping it in a
+    threadpool context manager on every request. Session cleanup is
+    handled by the test_session fixture.
     """
+    from app.database import get_db_session
+    from app.main import app
 
-    def override_get_db():
-        try:
-            yield test_session
-        finally:
-            pass  # Session cleanup is handled by test_session fixture
+    async def override_get_db() -> "Session":
+        return test_session
 
     app.dependency_overrides[get_db_session] = override_get_db
     yield test_session
     app.dependency_overrides.clear()
 
 
-@pytest.fixture(scope="function")
-def test_client(mock_db_session, mock_env_vars) -> TestClient:
+@contextmanager
+def _rate_limiter_off(app: "FastAPI") -> Iterator[None]:
+    """
+    Switch the app's rate limiter off for as long as a session client is open.
+
+    Most tests never exercise rate limiting, so there is no point in
+    resetting limiter storage around each of them. Tests that do assert
+    on 429 responses opt back in with the ``rate_limiter`` fixture. Doing
+    this from the client fixtures rather than an autouse fixture keeps runs
+    that never touch the API from importing the app.
+    """
+    app.state.limiter.enabled = False
+    try:
+        yield
+    finally:
+        app.state.limiter.enabled = True
+
+
+@pytest.fixture(scope="session")
+async def session_async_client(
+    mock_env_vars,
+) -> AsyncGenerator["AsyncClient", None]:
     """
-    Create a test client for the FastAPI application.
+    Open one async client over the ASGI app for the whole test session.
 
-    This client can be used for synchronous API testing.
+    Async tests and fixtures share a session-scoped event loop (see pytest.ini),
+    so the client is always used from the loop that opened it. The rate
+    limiter is switched off while the client is open (see _rate_limiter_off).
     """
-    with TestClient(app) as client:
+    from httpx import AsyncClient, ASGITransport
+
+    from app.main import app
+
+    with _rate_limiter_off(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+
+
+@pytest.fixture(scope="session")
+def session_test_client(mock_env_vars) -> Generator["TestClient", None, None]:
+    """
+    Start one synchronous TestClient for the whole test session.
+
+    Entering TestClient runs the app's startup events and builds its thread
+    portal; sharing the started client saves that for every test using it.
+    TESTING is set above, so startup skips database initialisation. Tests
+    install their own dependency overrides per test. The rate limiter is
+    switched off while the client is open (see _rate_limiter_off).
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with _rate_limiter_off(app), TestClient(app) as client:
         yield client
 
 
 @pytest.fixture(scope="function")
-async def async_test_client(mock_db_session, mock_env_vars) -> AsyncClient:
+def client(mock_db_session, session_async_client) -> "AsyncClient":
     """
-    Create an async test client for the FastAPI application.
+    Provide the shared async API client wired to this test's database session.
 
-    This client should be used for testing async endpoints.
+    Requests go straight through ASGITransport, so tests await them instead
+    of crossing the thread portal a synchronous TestClient would use.
     """
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        yield client
+    return session_async_client
 
 
-@pytest.fixture
-def mock_geojson_data() -> Dict[str, Any]:
-    """Sample GeoJSON data for testing spatial endpoints."""
-    return {
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of nested dicts and lists."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Sample payloads are built once at import time and shared by every test
+# that requests them. They are read-only, so a stray mutation raises instead
+# of leaking into later tests.
+MOCK_GEOJSON_DATA: Mapping[str, Any] = _freeze(
+    {
         "type": "FeatureCollection",
         "features": [
             {
                 "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [-96.7970, 32.7767]},
+                "geometry": _DALLAS_POINT,
                 "properties": {
                     "geoid": "12345",
                     "all_jobs_zscore": 1.5,
@@ -292,29 +439,23 @@ def mock_geojson_data() -> Dict[str, Any]:
             }
         ],
     }
-
-
-@pytest.fixture
-def mock_occupation_data() -> list:
-    """Sample occupation data for testing."""
-    return [
-        "Healthcare Support",
-        "Computer and Mathematical",
-        "Education and Training",
-        "Business and Financial Operations",
-        "Construction and Extraction",
-    ]
-
-
-@pytest.fixture
-def mock_occupation_spatial_data() -> Dict[str, Any]:
-    """Sample occupation spatial data for testing."""
-    return {
+)
+
+MOCK_OCCUPATION_DATA: Tuple[str, ...] = (
+    "Healthcare Support",
+    "Computer and Mathematical",
+    "Education and Training",
+    "Business and Financial Operations",
+    "Construction and Extraction",
+)
+
+MOCK_OCCUPATION_SPATIAL_DATA: Mapping[str, Any] = _freeze(
+    {
         "type": "FeatureCollection",
         "features": [
             {
                 "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [-96.7970, 32.7767]},
+                "geometry": _DALLAS_POINT,
                 "properties": {
                     "geoid": "48257050209",
                     "category": "51-3091",
@@ -325,7 +466,7 @@ def mock_occupation_spatial_data() -> Dict[str, Any]:
             },
             {
                 "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [-96.3838, 32.7399]},
+                "geometry": _KAUFMAN_POINT,
                 "properties": {
                     "geoid": "48257050213",
                     "category": "51-3091",
@@ -336,53 +477,134 @@ def mock_occupation_spatial_data() -> Dict[str, Any]:
             },
         ],
     }
+)
 
 
-@pytest.fixture(autouse=True)
-def reset_rate_limiter():
-    """
-    Reset rate limiter between tests to avoid rate limit issues.
+@pytest.fixture
+def mock_geojson_data() -> Mapping[str, Any]:
+    """Sample GeoJSON data for testing spatial endpoints."""
+    return MOCK_GEOJSON_DATA
 
-    This fixture automatically runs for every test.
-    """
-    # Clear any rate limit state
-    if hasattr(app.state, "limiter"):
-        # Reset the limiter's storage
-        app.state.limiter.reset()
-    yield
+
+@pytest.fixture
+def mock_occupation_data() -> Tuple[str, ...]:
+    """Sample occupation data for testing."""
+    return MOCK_OCCUPATION_DATA
 
 
 @pytest.fixture
-def mock_sqlalchemy_query():
+def mock_occupation_spatial_data() -> Mapping[str, Any]:
+    """Sample occupation spatial data for testing."""
+    return MOCK_OCCUPATION_SPATIAL_DATA
+
+
+@pytest.fixture
+def rate_limiter():
+    """
+    Re-enable the rate limiter, with empty storage, for a single test.
+    """
+    from app.main import app
+
+    limiter = app.state.limiter
+    limiter.reset()
+    limiter.enabled = True
+    yield limiter
+    limiter.enabled = False
+
+
+class _QueryStub:
     """
-    Mock SQLAlchemy query for unit testing without database.
+    Minimal chainable stand-in for a SQLAlchemy Query.
 
-    Useful for testing service methods in isolation.
+    Filtering and ordering methods return the stub itself; ``all`` and
+    ``first`` read from ``rows``. Unlike MagicMock, unknown attributes
+    raise AttributeError instead of silently returning child mocks.
     """
-    mock_query = MagicMock()
-    mock_session = MagicMock()
-    mock_session.query.return_value = mock_query
-    return mock_session, mock_query
 
+    def __init__(self, rows: Optional[List[Any]] = None) -> None:
+        self.rows: List[Any] = rows if rows is not None else []
+
+    def filter(self, *args: Any, **kwargs: Any) -> "_QueryStub":
+        return self
+
+    def filter_by(self, **kwargs: Any) -> "_QueryStub":
+        return self
+
+    def order_by(self, *args: Any) -> "_QueryStub":
+        return self
+
+    def limit(self, count: int) -> "_QueryStub":
+        return self
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
+    def all(self) -> List[Any]:
+        return self.rows
+
+    def first(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+
+@pytest.fixture
+def mock_sqlalchemy_query():
     """
-    Set up the test environment before any tests run.
+    Stub SQLAlchemy session and query for unit testing without database.
 
-    This fixture runs automatically at the start of the test session.
-    Environment variables are already set at module level before imports.
+    Useful for testing service methods in isolation. Set ``query.rows`` to
+    control what ``all()`` and ``first()`` return.
     """
-    # Environment variables are already set at module import time
-    # This fixture is kept for any additional setup/teardown needed
+    query = _QueryStub()
+    session = SimpleNamespace(query=lambda *args, **kwargs: query)
+    return session, query
 
-    yield
 
-    # Cleanup
+def pytest_sessionfinish(session, exitstatus):
+    """Drop the test-only environment variables set at the top of this module."""
     os.environ.pop("TESTING", None)
     os.environ.pop("SQL_ECHO", None)
 
 
+# All capture_logs blocks share one buffer and handler. The handler is
+# attached while at least one block is open, and each block reads back only
+# the slice of the buffer written between its own entry and exit, so nested
+# blocks never clear or detach each other.
+_LOG_BUFFER = StringIO()
+_LOG_HANDLER = logging.StreamHandler(_LOG_BUFFER)
+_LOG_HANDLER.setLevel(logging.DEBUG)
+_LOG_HANDLER.setFormatter(logging.Formatter())
+
+
+class _LogCapture:
+    """Context manager that records root logger output for one block."""
+
+    _depth = 0
+
+    def __init__(self) -> None:
+        self._start = 0
+        self._end: Optional[int] = None
+
+    @property
+    def output(self) -> str:
+        """Log text recorded by this block, inside it or after it has exited."""
+        return _LOG_BUFFER.getvalue()[self._start : self._end]
+
+    def __enter__(self) -> Self:
+        if _LogCapture._depth == 0:
+            logging.getLogger().addHandler(_LOG_HANDLER)
+        _LogCapture._depth += 1
+        self._start = _LOG_BUFFER.tell()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._end = _LOG_BUFFER.tell()
+        _LogCapture._depth -= 1
+        if _LogCapture._depth == 0:
+            logging.getLogger().removeHandler(_LOG_HANDLER)
+
+
 @pytest.fixture
 def capture_logs():
     """
@@ -395,21 +617,4 @@ def capture_logs():
                 pass
             assert "expected message" in logs.output
     """
-    import logging
-    from io import StringIO
-
-    class LogCapture:
-        def __init__(self):
-            self.output = StringIO()
-            self.handler = logging.StreamHandler(self.output)
-            self.handler.setLevel(logging.DEBUG)
-
-        def __enter__(self):
-            logging.getLogger().addHandler(self.handler)
-            return self
-
-        def __exit__(self, *args):
-            logging.getLogger().removeHandler(self.handler)
-            self.output = self.output.getvalue()
-
-    return LogCapture
+    return _LogCapture
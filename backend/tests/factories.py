@@ -6,14 +6,104 @@ These factories provide consistent test data generation for models.
 
 import factory
 from factory.alchemy import SQLAlchemyModelFactory
-from faker import Faker
-from geoalchemy2.elements import WKTElement
+from geoalchemy2.elements import WKBElement
+import itertools
 import random
+import struct
+from bisect import bisect_right
 
 from app.models import OccupationLvlData, TTIClone, OccupationCode
 
 
-fake = Faker()
+# One generator instance shared by every factory in this module
+_rng = random.Random()
+
+OCCUPATION_CATEGORIES = (
+    "Healthcare Support",
+    "Computer and Mathematical",
+    "Education, Training, and Library",
+    "Business and Financial Operations",
+    "Construction and Extraction",
+    "Food Preparation and Serving Related",
+    "Office and Administrative Support",
+    "Production",
+    "Transportation and Material Moving",
+    "Sales and Related",
+    "Installation, Maintenance, and Repair",
+    "Personal Care and Service",
+    "Architecture and Engineering",
+    "Life, Physical, and Social Science",
+    "Arts, Design, Entertainment, Sports, and Media",
+    "Management",
+    "Healthcare Practitioners and Technical",
+    "Protective Service",
+    "Building and Grounds Cleaning and Maintenance",
+    "Community and Social Service",
+    "Legal",
+    "Farming, Fishing, and Forestry",
+)
+
+# "11-" through "100-", indexed by sequence number modulo 90
+_OCCUPATION_CODE_PREFIXES = tuple(f"{11 + i:02d}-" for i in range(90))
+
+# Bounding box for the Dallas-Fort Worth area
+DFW_LON_RANGE = (-97.5, -96.5)
+DFW_LAT_RANGE = (32.5, 33.0)
+
+# Little-endian EWKB point: byte order, geometry type, SRID, x, y
+_EWKB_POINT = struct.Struct("<BIIdd")
+_EWKB_POINT_TYPE = 0x20000001  # Point with the SRID-present flag set
+
+# Z-scores typically range from -3 to 3
+ZSCORE_RANGE = (-3.0, 3.0)
+
+# Lower bounds of the Medium and High categories; below -1.0 is Low
+ZSCORE_CATEGORY_BOUNDS = (-1.0, 1.0)
+ZSCORE_CATEGORIES = ("Low", "Medium", "High")
+
+
+def _random_points(size):
+    """Generate ``size`` random (lon, lat) pairs inside the DFW bounding box."""
+    uniform = _rng.uniform
+    min_lon, max_lon = DFW_LON_RANGE
+    min_lat, max_lat = DFW_LAT_RANGE
+    return [(uniform(min_lon, max_lon), uniform(min_lat, max_lat)) for _ in range(size)]
+
+
+def _point_ewkb(lon, lat):
+    """Build an SRID 4326 point as extended WKB, skipping WKT formatting/parsing."""
+    return WKBElement(
+        _EWKB_POINT.pack(1, _EWKB_POINT_TYPE, 4326, lon, lat), srid=4326, extended=True
+    )
+
+
+# Census tract identifiers for TTIClone rows, shared by the factory and
+# build_fast_batch so the two never hand out the same geoid
+_tti_geoid_numbers = itertools.count()
+
+
+def _next_tti_geoid():
+    """Next unique GEOID of the form 48NNNNNNNNN."""
+    return f"48{next(_tti_geoid_numbers):09d}"
+
+
+def _random_zscore():
+    """Random z-score within ZSCORE_RANGE, rounded to two decimals."""
+    return round(_rng.uniform(*ZSCORE_RANGE), 2)
+
+
+def _random_feature_properties():
+    """Random TTI-style properties for a GeoJSON feature."""
+    choice = _rng.choice
+    return {
+        "geoid": f"{_rng.randrange(100_000_000_000):011d}",
+        "all_jobs_zscore": _random_zscore(),
+        "all_jobs_zscore_cat": choice(ZSCORE_CATEGORIES),
+        "living_wage_zscore": _random_zscore(),
+        "living_wage_zscore_cat": choice(ZSCORE_CATEGORIES),
+        "not_living_wage_zscore": _random_zscore(),
+        "not_living_wage_zscore_cat": choice(ZSCORE_CATEGORIES),
+    }
 
 
 class BaseFactory(SQLAlchemyModelFactory):
@@ -30,7 +120,9 @@ class OccupationCodeFactory(BaseFactory):
     class Meta:
         model = OccupationCode
 
-    occupation_code = factory.Sequence(lambda n: f"{11 + n % 90:02d}-{1000 + n:04d}")
+    occupation_code = factory.Sequence(
+        lambda n: f"{_OCCUPATION_CODE_PREFIXES[n % 90]}{1000 + n:04d}"
+    )
     occupation_name = factory.Faker("job")
 
 
@@ -40,33 +132,7 @@ class OccupationLvlDataFactory(BaseFactory):
     class Meta:
         model = OccupationLvlData
 
-    category = factory.Faker(
-        "random_element",
-        elements=[
-            "Healthcare Support",
-            "Computer and Mathematical",
-            "Education, Training, and Library",
-            "Business and Financial Operations",
-            "Construction and Extraction",
-            "Food Preparation and Serving Related",
-            "Office and Administrative Support",
-            "Production",
-            "Transportation and Material Moving",
-            "Sales and Related",
-            "Installation, Maintenance, and Repair",
-            "Personal Care and Service",
-            "Architecture and Engineering",
-            "Life, Physical, and Social Science",
-            "Arts, Design, Entertainment, Sports, and Media",
-            "Management",
-            "Healthcare Practitioners and Technical",
-            "Protective Service",
-            "Building and Grounds Cleaning and Maintenance",
-            "Community and Social Service",
-            "Legal",
-            "Farming, Fishing, and Forestry",
-        ],
-    )
+    category = factory.LazyFunction(lambda: _rng.choice(OCCUPATION_CATEGORIES))
 
 
 class TTICloneFactory(BaseFactory):
@@ -76,44 +142,22 @@ class TTICloneFactory(BaseFactory):
         model = TTIClone
 
     # Generate a unique GEOID (census tract identifier)
-    geoid = factory.Sequence(lambda n: f"48{str(n).zfill(9)}")
-
-    # Z-scores typically range from -3 to 3
-    all_jobs_zscore = factory.Faker(
-        "pyfloat",
-        left_digits=1,
-        right_digits=2,
-        positive=False,
-        min_value=-3.0,
-        max_value=3.0,
-    )
+    geoid = factory.LazyFunction(_next_tti_geoid)
+
+    all_jobs_zscore = factory.LazyFunction(_random_zscore)
 
     # Category based on z-score
     all_jobs_zscore_cat = factory.LazyAttribute(
         lambda obj: TTICloneFactory._categorize_zscore(obj.all_jobs_zscore)
     )
 
-    living_wage_zscore = factory.Faker(
-        "pyfloat",
-        left_digits=1,
-        right_digits=2,
-        positive=False,
-        min_value=-3.0,
-        max_value=3.0,
-    )
+    living_wage_zscore = factory.LazyFunction(_random_zscore)
 
     living_wage_zscore_cat = factory.LazyAttribute(
         lambda obj: TTICloneFactory._categorize_zscore(obj.living_wage_zscore)
     )
 
-    not_living_wage_zscore = factory.Faker(
-        "pyfloat",
-        left_digits=1,
-        right_digits=2,
-        positive=False,
-        min_value=-3.0,
-        max_value=3.0,
-    )
+    not_living_wage_zscore = factory.LazyFunction(_random_zscore)
 
     not_living_wage_zscore_cat = factory.LazyAttribute(
         lambda obj: TTICloneFactory._categorize_zscore(obj.not_living_wage_zscore)
@@ -121,10 +165,7 @@ class TTICloneFactory(BaseFactory):
 
     # Generate random point geometry (Dallas area coordinates)
     geom = factory.LazyFunction(
-        lambda: WKTElement(
-            f"POINT({random.uniform(-97.5, -96.5)} {random.uniform(32.5, 33.0)})",
-            srid=4326,
-        )
+        lambda: _point_ewkb(_rng.uniform(*DFW_LON_RANGE), _rng.uniform(*DFW_LAT_RANGE))
     )
 
     @staticmethod
@@ -132,12 +173,7 @@ class TTICloneFactory(BaseFactory):
         """Categorize z-score into High/Medium/Low."""
         if zscore is None:
             return None
-        if zscore >= 1.0:
-            return "High"
-        elif zscore >= -1.0:
-            return "Medium"
-        else:
-            return "Low"
+        return ZSCORE_CATEGORIES[bisect_right(ZSCORE_CATEGORY_BOUNDS, zscore)]
 
     @classmethod
     def create_batch_with_geometry(cls, size, session=None, **kwargs):
@@ -145,34 +181,52 @@ class TTICloneFactory(BaseFactory):
         Create a batch of TTIClone objects with varied geometry types.
 
         This method creates points distributed across the Dallas-Fort Worth area.
+        When a session is given, the whole batch is added and flushed at once so
+        SQLAlchemy can issue a single multi-row INSERT instead of committing each
+        instance separately.
         """
-        instances = []
+        # Every row gets its own point, so a caller-supplied geom is ignored
+        kwargs.pop("geom", None)
+
+        instances = [
+            cls.build(geom=_point_ewkb(lon, lat), **kwargs)
+            for lon, lat in _random_points(size)
+        ]
 
-        # Define bounding box for Dallas-Fort Worth area
-        min_lon, max_lon = -97.5, -96.5
-        min_lat, max_lat = 32.5, 33.0
+        if session:
+            session.add_all(instances)
+            session.flush()
 
-        for i in range(size):
-            # Generate random coordinates within bounds
-            lon = random.uniform(min_lon, max_lon)
-            lat = random.uniform(min_lat, max_lat)
+        return instances
 
-            # Create WKT geometry
-            geom = WKTElement(f"POINT({lon} {lat})", srid=4326)
+    @classmethod
+    def build_fast_batch(cls, size):
+        """
+        Build transient TTIClone objects without going through factory-boy.
 
-            # Override geometry in kwargs
-            kwargs_copy = kwargs.copy()
-            kwargs_copy["geom"] = geom
+        Values are drawn the same way as the declarations above and geoids
+        come from the same counter, but each row is a plain TTIClone(...)
+        call. Use this for tests that never touch the database.
+        """
+        categorize = cls._categorize_zscore
+        instances = []
 
-            # Create instance
-            if session:
-                instance = cls._create(
-                    model_class=cls._meta.model, session=session, **kwargs_copy
+        for lon, lat in _random_points(size):
+            all_jobs = _random_zscore()
+            living_wage = _random_zscore()
+            not_living_wage = _random_zscore()
+            instances.append(
+                TTIClone(
+                    geoid=_next_tti_geoid(),
+                    all_jobs_zscore=all_jobs,
+                    all_jobs_zscore_cat=categorize(all_jobs),
+                    living_wage_zscore=living_wage,
+                    living_wage_zscore_cat=categorize(living_wage),
+                    not_living_wage_zscore=not_living_wage,
+                    not_living_wage_zscore_cat=categorize(not_living_wage),
+                    geom=_point_ewkb(lon, lat),
                 )
-            else:
-                instance = cls.build(**kwargs_copy)
-
-            instances.append(instance)
+            )
 
         return instances
 
@@ -189,23 +243,30 @@ class GeoJSONFeatureFactory(factory.Factory):
         lambda: {
             "type": "Point",
             "coordinates": [
-                random.uniform(-97.5, -96.5),  # longitude
-                random.uniform(32.5, 33.0),  # latitude
+                _rng.uniform(*DFW_LON_RANGE),  # longitude
+                _rng.uniform(*DFW_LAT_RANGE),  # latitude
             ],
         }
     )
 
-    properties = factory.LazyFunction(
-        lambda: {
-            "geoid": fake.numerify(text="###########"),
-            "all_jobs_zscore": round(random.uniform(-3.0, 3.0), 2),
-            "all_jobs_zscore_cat": random.choice(["High", "Medium", "Low"]),
-            "living_wage_zscore": round(random.uniform(-3.0, 3.0), 2),
-            "living_wage_zscore_cat": random.choice(["High", "Medium", "Low"]),
-            "not_living_wage_zscore": round(random.uniform(-3.0, 3.0), 2),
-            "not_living_wage_zscore_cat": random.choice(["High", "Medium", "Low"]),
+    properties = factory.LazyFunction(_random_feature_properties)
+
+    @classmethod
+    def fast(cls, lon=None, lat=None):
+        """
+        Build a feature dict directly, skipping factory-boy's declaration pass.
+
+        Produces the same shape as calling the factory. Coordinates default to
+        a random point in the DFW area. Use this in loops that build many
+        read-only features.
+        """
+        if lon is None or lat is None:
+            ((lon, lat),) = _random_points(1)
+        return {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": _random_feature_properties(),
         }
-    )
 
 
 class GeoJSONFeatureCollectionFactory(factory.Factory):
@@ -216,44 +277,54 @@ class GeoJSONFeatureCollectionFactory(factory.Factory):
 
     type = "FeatureCollection"
 
+    # Draw every coordinate up front and build plain dicts, rather than running
+    # the full GeoJSONFeatureFactory once per feature
     features = factory.LazyFunction(
-        lambda: [GeoJSONFeatureFactory() for _ in range(random.randint(5, 10))]
+        lambda: [
+            GeoJSONFeatureFactory.fast(lon, lat)
+            for lon, lat in _random_points(_rng.randint(5, 10))
+        ]
     )
 
 
+# Rows per tier and the (low, high) ranges for the all-jobs, living-wage and
+# not-living-wage z-scores used by create_test_database_data
+_PERFORMANCE_TIERS = (
+    (3, (1.5, 3.0), (1.5, 3.0), (-3.0, -1.5)),  # High performing areas
+    (4, (-0.5, 0.5), (-0.5, 0.5), (-0.5, 0.5)),  # Medium performing areas
+    (3, (-3.0, -1.5), (-3.0, -1.5), (1.5, 3.0)),  # Low performing areas
+)
+
+
 # Utility functions for test data generation
+#
+# These take the session as an argument and add what they build to it, rather
+# than assigning Factory._meta.sqlalchemy_session, so concurrent tests using
+# different sessions never share factory state.
 def create_sample_occupation_data(session, count=10):
     """Create sample occupation data for testing."""
-    occupations = [
-        "Healthcare Support",
-        "Computer and Mathematical",
-        "Education, Training, and Library",
-        "Business and Financial Operations",
-        "Construction and Extraction",
-        "Food Preparation and Serving Related",
-        "Office and Administrative Support",
-        "Production",
-        "Transportation and Material Moving",
-        "Sales and Related",
-    ]
-
-    # Configure factory to use the session
-    OccupationLvlDataFactory._meta.sqlalchemy_session = session
+    occupations = OCCUPATION_CATEGORIES[:10]
 
     # Create unique occupations
-    created = []
-    for i in range(min(count, len(occupations))):
-        occupation = OccupationLvlDataFactory(category=occupations[i])
-        created.append(occupation)
+    created = [
+        OccupationLvlDataFactory.build(category=category)
+        for category in occupations[:count]
+    ]
+    session.add_all(created)
 
     session.commit()
     return created
 
 
-def create_sample_spatial_data(session, count=10):
-    """Create sample spatial data for testing."""
-    # Configure factory to use the session
-    TTICloneFactory._meta.sqlalchemy_session = session
+def create_sample_spatial_data(session, count=10, persist=True):
+    """
+    Create sample spatial data for testing.
+
+    With ``persist=False`` the rows are only built in memory and the session
+    is left untouched.
+    """
+    if not persist:
+        return TTICloneFactory.build_fast_batch(count)
 
     # Create spatial data with varied z-scores
     spatial_data = TTICloneFactory.create_batch_with_geometry(count, session=session)
@@ -271,39 +342,19 @@ def create_test_database_data(session):
     # Create occupation data
     occupations = create_sample_occupation_data(session, count=15)
 
-    # Create spatial data with various z-score combinations
-    spatial_data = []
-
-    # High performing areas
-    for i in range(3):
-        spatial_data.append(
-            TTICloneFactory(
-                all_jobs_zscore=random.uniform(1.5, 3.0),
-                living_wage_zscore=random.uniform(1.5, 3.0),
-                not_living_wage_zscore=random.uniform(-3.0, -1.5),
-            )
-        )
-
-    # Medium performing areas
-    for i in range(4):
-        spatial_data.append(
-            TTICloneFactory(
-                all_jobs_zscore=random.uniform(-0.5, 0.5),
-                living_wage_zscore=random.uniform(-0.5, 0.5),
-                not_living_wage_zscore=random.uniform(-0.5, 0.5),
-            )
-        )
-
-    # Low performing areas
-    for i in range(3):
-        spatial_data.append(
-            TTICloneFactory(
-                all_jobs_zscore=random.uniform(-3.0, -1.5),
-                living_wage_zscore=random.uniform(-3.0, -1.5),
-                not_living_wage_zscore=random.uniform(1.5, 3.0),
-            )
+    # Create spatial data with various z-score combinations, one tier at a time
+    uniform = _rng.uniform
+    spatial_data = [
+        TTICloneFactory.build(
+            all_jobs_zscore=uniform(*all_jobs),
+            living_wage_zscore=uniform(*living_wage),
+            not_living_wage_zscore=uniform(*not_living_wage),
         )
+        for count, all_jobs, living_wage, not_living_wage in _PERFORMANCE_TIERS
+        for _ in range(count)
+    ]
 
+    session.add_all(spatial_data)
     session.commit()
 
     return {"occupations": occupations, "spatial_data": spatial_data}
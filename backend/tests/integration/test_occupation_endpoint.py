@@ -51,14 +51,14 @@ def setup_occupation_codes(test_session, occupation_test_data):
 class TestOccupationEndpoint:
     """Integration tests for /occupation_ids endpoint with new response format."""
 
-    def test_occupation_ids_empty_database(self, test_client, test_session):
+    async def test_occupation_ids_empty_database(self, client, test_session):
         """Test endpoint returns empty list when no occupations exist."""
         # Ensure database is empty
         test_session.execute(text("DELETE FROM occupation_codes"))
         test_session.commit()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert
         assert response.status_code == 200
@@ -66,7 +66,7 @@ class TestOccupationEndpoint:
         assert "occupations" in data
         assert data["occupations"] == []
 
-    def test_occupation_ids_with_data(self, test_client, test_session):
+    async def test_occupation_ids_with_data(self, client, test_session):
         """Test endpoint returns occupation codes and names from occupation_codes table."""
         # Clear existing data to ensure clean test
         test_session.execute(text("DELETE FROM occupation_codes"))
@@ -91,7 +91,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert
         assert response.status_code == 200
@@ -115,7 +115,7 @@ class TestOccupationEndpoint:
             occupation_dict["99-0001"] == "99-0001"
         )  # NULL name uses code as fallback
 
-    def test_occupation_ids_sorted(self, test_client, test_session):
+    async def test_occupation_ids_sorted(self, client, test_session):
         """Test that occupations are returned sorted by code."""
         # Clear existing data to ensure clean test
         test_session.execute(text("DELETE FROM occupation_codes"))
@@ -140,7 +140,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert sorted
         assert response.status_code == 200
@@ -148,7 +148,7 @@ class TestOccupationEndpoint:
         codes = [occ["code"] for occ in data["occupations"]]
         assert codes == sorted(codes)
 
-    def test_occupation_ids_caching_behavior(self, test_client, test_session):
+    async def test_occupation_ids_caching_behavior(self, client, test_session):
         """Test that occupation data caching is disabled in test mode."""
         # Clear existing data to ensure clean test
         test_session.execute(text("DELETE FROM occupation_codes"))
@@ -169,7 +169,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # First request
-        response1 = test_client.get("/occupation_ids")
+        response1 = await client.get("/occupation_ids")
         assert response1.status_code == 200
         data1 = response1.json()
         assert len(data1["occupations"]) == 1
@@ -184,7 +184,7 @@ class TestOccupationEndpoint:
         test_session.commit()
 
         # Second request - in test mode, caching is disabled so we should see new data
-        response2 = test_client.get("/occupation_ids")
+        response2 = await client.get("/occupation_ids")
         assert response2.status_code == 200
         data2 = response2.json()
         assert len(data2["occupations"]) == 2  # Should see both occupations
@@ -193,10 +193,10 @@ class TestOccupationEndpoint:
         codes = {occ["code"] for occ in data2["occupations"]}
         assert codes == {"11-1021", "15-1251"}
 
-    def test_occupation_ids_database_driven(self, test_client, setup_occupation_codes):
+    async def test_occupation_ids_database_driven(self, client, setup_occupation_codes):
         """Test that endpoint uses occupation_codes table for data."""
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert success
         assert response.status_code == 200
@@ -214,10 +214,10 @@ class TestOccupationEndpoint:
         for test_occ in setup_occupation_codes:
             assert occupation_dict[test_occ["code"]] == test_occ["name"]
 
-    def test_occupation_ids_ordering(self, test_client, setup_occupation_codes):
+    async def test_occupation_ids_ordering(self, client, setup_occupation_codes):
         """Test that occupations are returned in sorted order by code."""
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert success
         assert response.status_code == 200
@@ -229,7 +229,7 @@ class TestOccupationEndpoint:
         # Verify they are sorted
         assert returned_codes == sorted(returned_codes)
 
-    def test_occupation_ids_with_empty_names(self, test_client, test_session):
+    async def test_occupation_ids_with_empty_names(self, client, test_session):
         """Test handling of occupation codes with empty or NULL names."""
         # Clear existing data to ensure clean test
         test_session.execute(text("DELETE FROM occupation_codes"))
@@ -254,7 +254,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert
         assert response.status_code == 200
@@ -272,7 +272,8 @@ class TestOccupationEndpoint:
             occupation_dict["33-3051"] == "33-3051"
         )  # Whitespace-only falls back to code
 
-    def test_occupation_ids_rate_limiting(self, test_client, test_session):
+    @pytest.mark.usefixtures("rate_limiter")
+    async def test_occupation_ids_rate_limiting(self, client, test_session):
         """Test that rate limiting is applied to the endpoint."""
         # Clear cache
         from app.occupation_cache import _cache
@@ -282,7 +283,7 @@ class TestOccupationEndpoint:
         # Make many requests quickly (rate limit is 30/minute)
         responses = []
         for _ in range(35):
-            response = test_client.get("/occupation_ids")
+            response = await client.get("/occupation_ids")
             responses.append(response.status_code)
 
         # Some requests should be rate limited (429)
@@ -290,7 +291,7 @@ class TestOccupationEndpoint:
         # But first 30 should succeed
         assert responses[:30].count(200) == 30
 
-    def test_occupation_ids_with_duplicates(self, test_client, test_session):
+    async def test_occupation_ids_with_duplicates(self, client, test_session):
         """Test that duplicate occupation codes are handled correctly."""
         # Clear existing data to ensure clean test
         test_session.execute(text("DELETE FROM occupation_codes"))
@@ -316,7 +317,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert
         assert response.status_code == 200
@@ -330,7 +331,9 @@ class TestOccupationEndpoint:
             codes.count("11-1021") == 1
         )  # No duplicates due to primary key constraint
 
-    def test_occupation_ids_response_format_validation(self, test_client, test_session):
+    async def test_occupation_ids_response_format_validation(
+        self, client, test_session
+    ):
         """Test that response format matches the expected schema."""
         # Clear existing data to ensure clean test
         test_session.execute(text("DELETE FROM occupation_codes"))
@@ -351,7 +354,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Validate response structure
         assert response.status_code == 200
@@ -382,8 +385,8 @@ class TestOccupationEndpoint:
             ("99-9999", "All Other Occupations"),
         ],
     )
-    def test_occupation_name_mappings(
-        self, test_client, test_session, code, expected_name
+    async def test_occupation_name_mappings(
+        self, client, test_session, code, expected_name
     ):
         """Test specific occupation code to name mappings."""
         # Clear existing data to ensure clean test
@@ -406,7 +409,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Assert
         assert response.status_code == 200
@@ -417,8 +420,8 @@ class TestOccupationEndpoint:
         assert occupation is not None
         assert occupation["name"] == expected_name
 
-    def test_occupation_ids_independent_of_occupation_lvl_data(
-        self, test_client, test_session
+    async def test_occupation_ids_independent_of_occupation_lvl_data(
+        self, client, test_session
     ):
         """Test that endpoint uses occupation_codes table, not occupation_lvl_data."""
         # Clear existing data from both tables to ensure clean test
@@ -443,7 +446,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request - should return empty since occupation_codes table is empty
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         assert response.status_code == 200
         data = response.json()
@@ -466,7 +469,7 @@ class TestOccupationEndpoint:
         _cache.clear()
 
         # Make request again
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         assert response.status_code == 200
         data = response.json()
@@ -105,14 +105,14 @@ def setup_school_data(test_session, school_test_data):
 class TestSchoolOfStudyIdsEndpoint:
     """Integration tests for /school_of_study_ids endpoint."""
 
-    def test_school_of_study_ids_empty_database(self, test_client, test_session):
+    async def test_school_of_study_ids_empty_database(self, client, test_session):
         """Test endpoint returns empty list when no school data exists."""
         # Ensure database is empty
         test_session.execute(text("DELETE FROM school_of_lvl_data"))
         test_session.commit()
 
         # Make request
-        response = test_client.get("/school_of_study_ids")
+        response = await client.get("/school_of_study_ids")
 
         # Assert
         assert response.status_code == 200
@@ -120,10 +120,10 @@ class TestSchoolOfStudyIdsEndpoint:
         assert "school_ids" in data
         assert data["school_ids"] == []
 
-    def test_school_of_study_ids_with_data(self, test_client, setup_school_data):
+    async def test_school_of_study_ids_with_data(self, client, setup_school_data):
         """Test endpoint returns all distinct school categories."""
         # Make request
-        response = test_client.get("/school_of_study_ids")
+        response = await client.get("/school_of_study_ids")
 
         # Assert
         assert response.status_code == 200
@@ -136,7 +136,7 @@ class TestSchoolOfStudyIdsEndpoint:
         returned_categories = set(data["school_ids"])
         assert returned_categories == expected_categories
 
-    def test_school_of_study_ids_duplicate_categories(self, test_client, test_session):
+    async def test_school_of_study_ids_duplicate_categories(self, client, test_session):
         """Test endpoint handles duplicate categories correctly."""
         # Clear existing data first
         test_session.execute(text("DELETE FROM school_of_lvl_data"))
@@ -156,7 +156,7 @@ class TestSchoolOfStudyIdsEndpoint:
         test_session.commit()
 
         # Make request
-        response = test_client.get("/school_of_study_ids")
+        response = await client.get("/school_of_study_ids")
 
         # Assert - should return unique categories only
         assert response.status_code == 200
@@ -165,12 +165,13 @@ class TestSchoolOfStudyIdsEndpoint:
         assert len(data["school_ids"]) == 2  # Only ETMS and BHGT
         assert set(data["school_ids"]) == {"ETMS", "BHGT"}
 
-    def test_school_of_study_ids_rate_limiting(self, test_client, setup_school_data):
+    @pytest.mark.usefixtures("rate_limiter")
+    async def test_school_of_study_ids_rate_limiting(self, client, setup_school_data):
         """Test that rate limiting is applied to the endpoint (30/minute)."""
         # Make many requests quickly
         responses = []
         for _ in range(35):
-            response = test_client.get("/school_of_study_ids")
+            response = await client.get("/school_of_study_ids")
             responses.append(response.status_code)
 
         # Some requests should be rate limited (429)
@@ -178,10 +179,10 @@ class TestSchoolOfStudyIdsEndpoint:
         # But first 30 should succeed
         assert responses[:30].count(200) == 30
 
-    def test_school_of_study_ids_response_format(self, test_client, setup_school_data):
+    async def test_school_of_study_ids_response_format(self, client, setup_school_data):
         """Test that response format matches the expected schema."""
         # Make request
-        response = test_client.get("/school_of_study_ids")
+        response = await client.get("/school_of_study_ids")
 
         # Validate response structure
         assert response.status_code == 200
@@ -202,8 +203,8 @@ class TestSchoolOfStudyDataEndpoint:
     """Integration tests for /school_of_study_data/{category} endpoint."""
 
     @patch("app.main.SchoolOfStudyService.get_school_spatial_data")
-    def test_school_of_study_data_valid_category(
-        self, mock_service, test_client, setup_school_data
+    async def test_school_of_study_data_valid_category(
+        self, mock_service, client, setup_school_data
     ):
         """Test endpoint with valid school category."""
         # Mock the spatial service to avoid PostGIS issues in SQLite
@@ -221,7 +222,7 @@ class TestSchoolOfStudyDataEndpoint:
         ]
         mock_service.return_value = mock_features
 
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/geo+json"
@@ -247,26 +248,26 @@ class TestSchoolOfStudyDataEndpoint:
         assert "openings_2024_zscore_color" in props
 
     @patch("app.main.SchoolOfStudyService.get_school_spatial_data")
-    def test_school_of_study_data_nonexistent_category(
-        self, mock_service, test_client, setup_school_data
+    async def test_school_of_study_data_nonexistent_category(
+        self, mock_service, client, setup_school_data
     ):
         """Test endpoint with category that doesn't exist."""
         mock_service.return_value = []  # Empty result
 
-        response = test_client.get("/school_of_study_data/NONEXISTENT")
+        response = await client.get("/school_of_study_data/NONEXISTENT")
 
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
         assert "No data found for school category: NONEXISTENT" in data["detail"]
 
-    def test_school_of_study_data_empty_database(self, test_client, test_session):
+    async def test_school_of_study_data_empty_database(self, client, test_session):
         """Test endpoint with empty database."""
         # Ensure database is empty
         test_session.execute(text("DELETE FROM school_of_lvl_data"))
         test_session.commit()
 
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         # Debug: print the response if it's not 404
         if response.status_code != 404:
@@ -277,7 +278,7 @@ class TestSchoolOfStudyDataEndpoint:
         assert "detail" in data
         assert "No data found for school category: ETMS" in data["detail"]
 
-    def test_school_of_study_data_multiple_features(self, test_client, test_session):
+    async def test_school_of_study_data_multiple_features(self, client, test_session):
         """Test endpoint returns multiple features for same category."""
         # Insert multiple features for same category
         test_session.execute(
@@ -292,7 +293,7 @@ class TestSchoolOfStudyDataEndpoint:
         )
         test_session.commit()
 
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         assert response.status_code == 200
         data = response.json()
@@ -307,9 +308,11 @@ class TestSchoolOfStudyDataEndpoint:
         geoids = [f["properties"]["geoid"] for f in data["features"]]
         assert len(set(geoids)) == 3  # All different geoids
 
-    def test_school_of_study_data_geometry_format(self, test_client, setup_school_data):
+    async def test_school_of_study_data_geometry_format(
+        self, client, setup_school_data
+    ):
         """Test that geometry is returned in correct GeoJSON format."""
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         assert response.status_code == 200
         data = response.json()
@@ -323,12 +326,13 @@ class TestSchoolOfStudyDataEndpoint:
         assert isinstance(geometry["coordinates"], list)
         assert len(geometry["coordinates"]) == 2  # Longitude, Latitude
 
-    def test_school_of_study_data_rate_limiting(self, test_client, setup_school_data):
+    @pytest.mark.usefixtures("rate_limiter")
+    async def test_school_of_study_data_rate_limiting(self, client, setup_school_data):
         """Test that rate limiting is applied to the endpoint (30/minute)."""
         # Make many requests quickly
         responses = []
         for _ in range(35):
-            response = test_client.get("/school_of_study_data/ETMS")
+            response = await client.get("/school_of_study_data/ETMS")
             responses.append(response.status_code)
 
         # Some requests should be rate limited (429)
@@ -336,7 +340,7 @@ class TestSchoolOfStudyDataEndpoint:
         # But first 30 should succeed
         assert responses[:30].count(200) == 30
 
-    def test_school_of_study_data_null_values(self, test_client, test_session):
+    async def test_school_of_study_data_null_values(self, client, test_session):
         """Test endpoint handles NULL values in optional fields."""
         # Insert data with NULL values
         test_session.execute(
@@ -349,7 +353,7 @@ class TestSchoolOfStudyDataEndpoint:
         )
         test_session.commit()
 
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         assert response.status_code == 200
         data = response.json()
@@ -367,11 +371,11 @@ class TestSchoolOfStudyDataEndpoint:
     @pytest.mark.parametrize(
         "category", ["BHGT", "CAED", "CE", "EDU", "ETMS", "HS", "LPS", "MIT"]
     )
-    def test_school_of_study_data_all_valid_categories(
-        self, test_client, setup_school_data, category
+    async def test_school_of_study_data_all_valid_categories(
+        self, client, setup_school_data, category
     ):
         """Test each valid school category individually."""
-        response = test_client.get(f"/school_of_study_data/{category}")
+        response = await client.get(f"/school_of_study_data/{category}")
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/geo+json"
@@ -381,41 +385,41 @@ class TestSchoolOfStudyDataEndpoint:
         assert len(data["features"]) == 1
         assert data["features"][0]["properties"]["category"] == category
 
-    def test_school_of_study_data_case_sensitivity(
-        self, test_client, setup_school_data
+    async def test_school_of_study_data_case_sensitivity(
+        self, client, setup_school_data
     ):
         """Test that category parameter is case sensitive."""
         # Test lowercase
-        response = test_client.get("/school_of_study_data/etms")
+        response = await client.get("/school_of_study_data/etms")
         assert response.status_code == 404
 
         # Test uppercase (should work)
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
         assert response.status_code == 200
 
-    def test_school_of_study_data_special_characters(
-        self, test_client, setup_school_data
+    async def test_school_of_study_data_special_characters(
+        self, client, setup_school_data
     ):
         """Test endpoint with special characters in category."""
         # Test with URL-encoded characters
-        response = test_client.get("/school_of_study_data/ET%20MS")
+        response = await client.get("/school_of_study_data/ET%20MS")
         assert response.status_code == 404
 
         # Test with invalid characters
-        response = test_client.get("/school_of_study_data/ET@MS")
+        response = await client.get("/school_of_study_data/ET@MS")
         assert response.status_code == 404
 
-    def test_school_of_study_data_response_headers(
-        self, test_client, setup_school_data
+    async def test_school_of_study_data_response_headers(
+        self, client, setup_school_data
     ):
         """Test that response headers are set correctly."""
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/geo+json"
         assert response.headers["content-disposition"] == "inline"
 
-    def test_school_of_study_data_large_dataset(self, test_client, test_session):
+    async def test_school_of_study_data_large_dataset(self, client, test_session):
         """Test endpoint with large number of features for one category."""
         # Insert 50 features for ETMS category
         for i in range(50):
@@ -436,7 +440,7 @@ class TestSchoolOfStudyDataEndpoint:
             )
         test_session.commit()
 
-        response = test_client.get("/school_of_study_data/ETMS")
+        response = await client.get("/school_of_study_data/ETMS")
 
         assert response.status_code == 200
         data = response.json()
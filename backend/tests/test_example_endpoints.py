@@ -13,7 +13,7 @@ class TestOccupationEndpoints:
     """Example tests for occupation-related endpoints."""
 
     @pytest.mark.api
-    def test_get_occupation_ids_with_mock(self, test_client):
+    async def test_get_occupation_ids_with_mock(self, client):
         """Test /occupation_ids endpoint with mocked service."""
         # Mock the service method to avoid database issues with SQLite
         with patch.object(
@@ -25,7 +25,7 @@ class TestOccupationEndpoints:
                 {"code": "25-0000", "name": "Education and Training"},
             ]
 
-            response = test_client.get("/occupation_ids")
+            response = await client.get("/occupation_ids")
 
             assert response.status_code == 200
             data = response.json()
@@ -37,13 +37,13 @@ class TestOccupationEndpoints:
 
     @pytest.mark.integration
     @pytest.mark.skip(reason="Requires PostgreSQL with jsi_data schema")
-    def test_get_occupation_ids_integration(self, test_client, test_session):
+    async def test_get_occupation_ids_integration(self, client, test_session):
         """Integration test for /occupation_ids endpoint."""
         # This test would work with a real PostgreSQL database
         # Create test data
         create_sample_occupation_data(test_session, count=5)
 
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         assert response.status_code == 200
         data = response.json()
@@ -55,7 +55,7 @@ class TestSpatialEndpoints:
     """Example tests for spatial data endpoints."""
 
     @pytest.mark.api
-    def test_get_geojson_with_mock(self, test_client, mock_geojson_data):
+    async def test_get_geojson_with_mock(self, client, mock_geojson_data):
         """Test /geojson endpoint with mocked service."""
         # Mock the service method
         from app.models import GeoJSONFeature, SpatialFeatureProperties
@@ -88,7 +88,7 @@ class TestSpatialEndpoints:
 
             mock_get_features.return_value = features
 
-            response = test_client.get("/geojson")
+            response = await client.get("/geojson")
 
             assert response.status_code == 200
             assert response.headers["content-type"] == "application/geo+json"
@@ -100,13 +100,13 @@ class TestSpatialEndpoints:
 
     @pytest.mark.integration
     @pytest.mark.skip(reason="Requires PostgreSQL with PostGIS")
-    def test_get_geojson_integration(self, test_client, test_session):
+    async def test_get_geojson_integration(self, client, test_session):
         """Integration test for /geojson endpoint."""
         # This test would work with a real PostgreSQL database with PostGIS
         # Create test spatial data
         create_sample_spatial_data(test_session, count=10)
 
-        response = test_client.get("/geojson")
+        response = await client.get("/geojson")
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/geo+json"
@@ -119,9 +119,10 @@ class TestSpatialEndpoints:
 class TestRateLimiting:
     """Example tests for rate limiting functionality."""
 
+    @pytest.mark.usefixtures("rate_limiter")
     @pytest.mark.api
     @pytest.mark.slow
-    def test_rate_limiting(self, test_client):
+    async def test_rate_limiting(self, client):
         """Test that rate limiting works."""
         # Mock the service to avoid database calls
         with patch.object(OccupationService, "get_occupation_ids") as mock_get_ids:
@@ -130,7 +131,7 @@ class TestRateLimiting:
             # The rate limit is 30/minute, so 31 requests should trigger it
             responses = []
             for i in range(31):
-                response = test_client.get("/occupation_ids")
+                response = await client.get("/occupation_ids")
                 responses.append(response)
 
             # Check that we got rate limited
@@ -142,14 +143,14 @@ class TestErrorHandling:
     """Example tests for error handling."""
 
     @pytest.mark.api
-    def test_database_error_handling(self, test_client):
+    async def test_database_error_handling(self, client):
         """Test handling of database errors."""
         with patch.object(
             OccupationService, "get_occupations_with_names"
         ) as mock_get_names:
             mock_get_names.side_effect = Exception("Database connection error")
 
-            response = test_client.get("/occupation_ids")
+            response = await client.get("/occupation_ids")
 
             assert response.status_code == 500
             error_data = response.json()
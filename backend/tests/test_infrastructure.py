@@ -5,10 +5,11 @@ Test to verify the test infrastructure is working correctly.
 import pytest
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from app.models import OccupationLvlData, TTIClone
 from tests.factories import (
+    GeoJSONFeatureFactory,
     OccupationLvlDataFactory,
     TTICloneFactory,
     create_sample_occupation_data,
@@ -19,10 +20,10 @@ from tests.factories import (
 class TestInfrastructure:
     """Verify test infrastructure components."""
 
-    def test_test_client_creation(self, test_client):
+    def test_client_creation(self, client):
         """Test that test client is created successfully."""
-        assert test_client is not None
-        assert isinstance(test_client, TestClient)
+        assert client is not None
+        assert isinstance(client, AsyncClient)
 
     def test_database_session(self, test_session):
         """Test that database session is created successfully."""
@@ -36,9 +37,8 @@ class TestInfrastructure:
     @pytest.mark.skip(reason="Requires PostgreSQL with schema support")
     def test_occupation_factory(self, test_session):
         """Test OccupationLvlDataFactory creates valid objects."""
-        OccupationLvlDataFactory._meta.sqlalchemy_session = test_session
-
-        occupation = OccupationLvlDataFactory()
+        occupation = OccupationLvlDataFactory.build()
+        test_session.add(occupation)
         assert occupation.category is not None
         assert isinstance(occupation.category, str)
 
@@ -54,9 +54,8 @@ class TestInfrastructure:
     @pytest.mark.skip(reason="Requires PostgreSQL with schema support")
     def test_tti_clone_factory(self, test_session):
         """Test TTICloneFactory creates valid objects."""
-        TTICloneFactory._meta.sqlalchemy_session = test_session
-
-        spatial_data = TTICloneFactory()
+        spatial_data = TTICloneFactory.build()
+        test_session.add(spatial_data)
         assert spatial_data.geoid is not None
         assert isinstance(spatial_data.all_jobs_zscore, float)
         assert spatial_data.all_jobs_zscore_cat in ["High", "Medium", "Low"]
@@ -76,13 +75,35 @@ class TestInfrastructure:
         assert len(spatial_data) == 3
         assert all(isinstance(s, TTIClone) for s in spatial_data)
 
+    def test_create_sample_spatial_data_without_persisting(self):
+        """Test the in-memory spatial data path needs no database session."""
+        spatial_data = create_sample_spatial_data(None, count=3, persist=False)
+
+        assert len(spatial_data) == 3
+        assert all(isinstance(s, TTIClone) for s in spatial_data)
+        assert len({s.geoid for s in spatial_data}) == 3
+        for s in spatial_data:
+            assert s.all_jobs_zscore_cat == TTICloneFactory._categorize_zscore(
+                s.all_jobs_zscore
+            )
+            assert s.geom.srid == 4326
+
+    def test_geojson_feature_fast_matches_factory(self):
+        """Test the direct feature builder produces the factory's shape."""
+        built = GeoJSONFeatureFactory()
+        fast = GeoJSONFeatureFactory.fast(-96.8, 32.7)
+
+        assert fast.keys() == built.keys()
+        assert fast["properties"].keys() == built["properties"].keys()
+        assert fast["geometry"] == {"type": "Point", "coordinates": [-96.8, 32.7]}
+
     @pytest.mark.asyncio
-    async def test_async_client(self, async_test_client):
+    async def test_async_client(self, client):
         """Test async test client creation."""
-        assert async_test_client is not None
+        assert client is not None
 
         # Test a simple async request
-        response = await async_test_client.get("/")
+        response = await client.get("/")
         assert response.status_code in [200, 404]  # Depends on if root endpoint exists
 
     def test_mock_env_vars(self, mock_env_vars):
@@ -94,14 +115,47 @@ class TestInfrastructure:
         assert os.getenv("URL") == "test_host:5432"
         assert os.getenv("DB") == "test_db"
 
+    def test_capture_logs(self, capture_logs):
+        """Test log capture is readable inside the block and reset per use."""
+        import logging
+
+        logger = logging.getLogger("tests.capture")
+        logger.setLevel(logging.INFO)
+
+        with capture_logs() as logs:
+            logger.info("first message")
+            assert "first message" in logs.output
+        assert "first message" in logs.output
+
+        with capture_logs() as logs:
+            logger.info("second message")
+        assert "second message" in logs.output
+        assert "first message" not in logs.output
+
+    def test_capture_logs_nested(self, capture_logs):
+        """Test that a nested capture neither clears nor detaches the outer one."""
+        import logging
+
+        logger = logging.getLogger("tests.capture")
+        logger.setLevel(logging.INFO)
+
+        with capture_logs() as outer:
+            logger.info("before inner")
+            with capture_logs() as inner:
+                logger.info("during inner")
+            logger.info("after inner")
+
+        assert inner.output == "during inner\n"
+        assert outer.output == "before inner\nduring inner\nafter inner\n"
+
     @pytest.mark.skip(reason="Requires PostgreSQL with schema support")
-    def test_api_endpoint_with_mocked_db(self, test_client, test_session):
+    async def test_api_endpoint_with_mocked_db(self, client, test_session):
         """Test that API endpoints work with mocked database."""
         # Create some test data
         create_sample_occupation_data(test_session, count=3)
 
         # Test the occupation_ids endpoint
-        response = test_client.get("/occupation_ids")
+        response = await client.get("/occupation_ids")
 
         # Even if it fails due to SQLite limitations, we're testing the infrastructure
         assert response is not None
@@ -7,7 +7,6 @@ while still providing useful debugging information via correlation IDs.
 
 import pytest
 from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 
@@ -23,7 +22,7 @@ def mock_app():
 
 
 @pytest.fixture
-def mock_client(mock_app):
+def mock_client(mock_app, session_test_client):
     """Create test client with mocked database."""
     # Mock the database session dependency
     mock_session = Mock(spec=Session)
@@ -35,8 +34,7 @@ def mock_client(mock_app):
 
     mock_app.dependency_overrides[get_db_session] = override_get_db
 
-    with TestClient(mock_app) as client:
-        yield client
+    yield session_test_client
 
     # Clean up
     mock_app.dependency_overrides.clear()
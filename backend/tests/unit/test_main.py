@@ -12,7 +12,6 @@ Tests cover:
 
 import pytest
 from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models import GeoJSONFeature, SpatialFeatureProperties
@@ -30,7 +29,7 @@ def mock_app():
 
 
 @pytest.fixture
-def mock_client(mock_app):
+def mock_client(mock_app, session_test_client):
     """Create test client with mocked database."""
     # Mock the database session dependency
     mock_session = Mock(spec=Session)
@@ -42,8 +41,7 @@ def mock_client(mock_app):
 
     mock_app.dependency_overrides[get_db_session] = override_get_db
 
-    with TestClient(mock_app) as client:
-        yield client
+    yield session_test_client
 
     # Clean up
     mock_app.dependency_overrides.clear()
@@ -74,6 +72,12 @@ class TestApplicationLifecycle:
         assert hasattr(mock_app.state, "limiter")
         assert mock_app.state.limiter is not None
 
+    def test_default_response_class_is_orjson(self, mock_app):
+        """Test that JSON responses are encoded with orjson by default."""
+        from fastapi.responses import ORJSONResponse
+
+        assert mock_app.router.default_response_class is ORJSONResponse
+
     def test_database_initialized_on_startup(self):
         """Test that database is initialized on module import."""
         # This test verifies that the module initialization calls are made
@@ -135,17 +139,12 @@ class TestOccupationIdsEndpoint:
         assert "An internal error occurred" in detail["message"]
         assert "Database connection failed" not in detail["message"]
 
+    @pytest.mark.usefixtures("rate_limiter")
     @patch("app.main.OccupationService.get_occupations_with_names")
     def test_get_occupation_ids_rate_limiting(self, mock_get_occupations, mock_client):
         """Test rate limiting on occupation_ids endpoint (30/minute)."""
         mock_get_occupations.return_value = [{"code": "11-1021", "name": "Test"}]
 
-        # Reset rate limiter
-        from app.main import app
-
-        if hasattr(app.state, "limiter"):
-            app.state.limiter.reset()
-
         # Make 30 requests (should all succeed)
         for i in range(30):
             response = mock_client.get("/occupation_ids")
@@ -246,17 +245,12 @@ class TestGeojsonEndpoint:
         assert "An internal error occurred" in detail["message"]
         assert "Spatial query failed" not in detail["message"]
 
+    @pytest.mark.usefixtures("rate_limiter")
     @patch("app.main.SpatialService.get_geojson_features")
     def test_get_geojson_rate_limiting(self, mock_get_features, mock_client):
         """Test rate limiting on geojson endpoint (10/minute)."""
         mock_get_features.return_value = []
 
-        # Reset rate limiter
-        from app.main import app
-
-        if hasattr(app.state, "limiter"):
-            app.state.limiter.reset()
-
         # Make 10 requests (should all succeed)
         for i in range(10):
             response = mock_client.get("/geojson")
@@ -280,6 +274,33 @@ class TestGeojsonEndpoint:
         assert response.headers["content-type"] == "application/geo+json"
         assert "application/geo+json" in response.headers.get("content-type", "")
 
+    @patch("app.main.SpatialService.get_twkb_features")
+    def test_get_geojson_twkb_format(self, mock_get_twkb, mock_client):
+        """Test that format=twkb returns the binary TWKB encoding."""
+        from app.twkb import decode_twkb_features
+
+        mock_get_twkb.return_value = [
+            {
+                "type": "Feature",
+                "geometry": b"\x01\x00\x02\x04",
+                "properties": {"geoid": "12345", "all_jobs_zscore": 1.5},
+            }
+        ]
+
+        response = mock_client.get("/geojson?format=twkb")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.twkb"
+        features = decode_twkb_features(response.content)
+        assert features[0]["geometry"] == b"\x01\x00\x02\x04"
+        assert features[0]["properties"]["geoid"] == "12345"
+
+    def test_get_geojson_invalid_format(self, mock_client):
+        """Test that unsupported formats are rejected."""
+        response = mock_client.get("/geojson?format=shapefile")
+
+        assert response.status_code == 422
+
     @patch("app.main.SpatialService")
     def test_get_geojson_large_dataset(self, mock_service_class, mock_client):
         """Test endpoint with large number of features."""
@@ -315,6 +336,41 @@ class TestGeojsonEndpoint:
         assert len(data["features"]) == 1000
 
 
+class TestOccupationDataEndpoint:
+    """Test /occupation_data/{category} endpoint."""
+
+    @patch("app.main.OccupationService.get_occupation_twkb_features")
+    def test_get_occupation_data_twkb_format(self, mock_get_twkb, mock_client):
+        """Test that format=twkb returns the binary TWKB encoding."""
+        from app.twkb import decode_twkb_features
+
+        mock_get_twkb.return_value = [
+            {
+                "type": "Feature",
+                "geometry": b"\x01\x00\x02\x04",
+                "properties": {"geoid": "48113020100", "category": "51-3091"},
+            }
+        ]
+
+        response = mock_client.get("/occupation_data/51-3091?format=twkb")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.twkb"
+        features = decode_twkb_features(response.content)
+        assert features == mock_get_twkb.return_value
+        mock_get_twkb.assert_called_once_with("51-3091")
+
+    @patch("app.main.OccupationService.get_occupation_twkb_features")
+    def test_get_occupation_data_twkb_not_found(self, mock_get_twkb, mock_client):
+        """Test that an empty TWKB result is a 404, as for GeoJSON."""
+        mock_get_twkb.return_value = []
+
+        response = mock_client.get("/occupation_data/51-3091?format=twkb")
+
+        assert response.status_code == 404
+        assert "No data found for occupation category" in response.json()["detail"]
+
+
 class TestErrorHandling:
     """Test application-wide error handling."""
 
@@ -349,17 +405,12 @@ class TestErrorHandling:
         assert response.status_code == 404
         assert "detail" in response.json()
 
+    @pytest.mark.usefixtures("rate_limiter")
     @patch("app.main.OccupationService.get_occupation_ids")
     def test_rate_limit_exception_handler(self, mock_get_ids, mock_client):
         """Test that rate limit exceptions are properly formatted."""
         mock_get_ids.return_value = []
 
-        # Reset rate limiter
-        from app.main import app
-
-        if hasattr(app.state, "limiter"):
-            app.state.limiter.reset()
-
         # Make requests until rate limited
         responses = []
         for i in range(35):  # More than the 30/minute limit
@@ -525,3 +576,46 @@ class TestResponseFormats:
         assert isinstance(data, dict)
         assert data["type"] == "FeatureCollection"
         assert "features" in data
+
+    @patch("app.main.SpatialService.get_geojson_features")
+    def test_large_response_gzipped(self, mock_get_features, mock_client):
+        """Test that responses over 1 KB are gzipped when the client accepts it."""
+        mock_get_features.return_value = [
+            GeoJSONFeature(
+                geometry={"type": "Point", "coordinates": [-96.7970, 32.7767]},
+                properties=SpatialFeatureProperties(
+                    geoid=f"48113{i:06d}",
+                    all_jobs_zscore=1.5,
+                    all_jobs_zscore_cat="High",
+                    living_wage_zscore=0.8,
+                    living_wage_zscore_cat="Medium",
+                    not_living_wage_zscore=-0.5,
+                    not_living_wage_zscore_cat="Low",
+                ),
+            )
+            for i in range(50)
+        ]
+
+        response = mock_client.get("/geojson", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # httpx transparently decompresses the body
+        assert len(response.json()["features"]) == 50
+
+        response = mock_client.get("/geojson", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert len(response.content) > 1000
+        assert len(response.json()["features"]) == 50
+
+    @patch("app.main.SpatialService.get_geojson_features")
+    def test_small_response_not_gzipped(self, mock_get_features, mock_client):
+        """Test that responses under the 1 KB threshold are sent uncompressed."""
+        mock_get_features.return_value = []
+
+        response = mock_client.get("/geojson", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
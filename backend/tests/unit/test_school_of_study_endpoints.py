@@ -2,7 +2,6 @@
 
 import pytest
 from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models import SchoolOfStudyGeoJSONFeature, SchoolOfStudySpatialProperties
@@ -20,7 +19,7 @@ def mock_app():
 
 
 @pytest.fixture
-def mock_client(mock_app):
+def mock_client(mock_app, session_test_client):
     """Create test client with mocked database."""
     # Mock the database session dependency
     mock_session = Mock(spec=Session)
@@ -32,8 +31,7 @@ def mock_client(mock_app):
 
     mock_app.dependency_overrides[get_db_session] = override_get_db
 
-    with TestClient(mock_app) as client:
-        yield client
+    yield session_test_client
 
     # Clean up
     mock_app.dependency_overrides.clear()
@@ -89,6 +87,7 @@ class TestSchoolOfStudyIdsEndpoint:
         assert data["detail"]["error_code"] == "INTERNAL_SERVER_ERROR"
         assert "Database connection failed" not in str(data["detail"])
 
+    @pytest.mark.usefixtures("rate_limiter")
     @patch("app.main.SchoolOfStudyService.get_school_ids")
     def test_get_school_of_study_ids_rate_limiting(
         self, mock_get_school_ids, mock_client
@@ -96,12 +95,6 @@ class TestSchoolOfStudyIdsEndpoint:
         """Test rate limiting on school_of_study_ids endpoint (30/minute)."""
         mock_get_school_ids.return_value = ["ETMS", "BHGT"]
 
-        # Reset rate limiter
-        from app.main import app
-
-        if hasattr(app.state, "limiter"):
-            app.state.limiter.reset()
-
         # Make 30 requests (should all succeed)
         for i in range(30):
             response = mock_client.get("/school_of_study_ids")
@@ -267,6 +260,7 @@ class TestSchoolOfStudyDataEndpoint:
         assert data["detail"]["error_code"] == "INTERNAL_SERVER_ERROR"
         assert "Spatial query failed" not in str(data["detail"])
 
+    @pytest.mark.usefixtures("rate_limiter")
     @patch("app.main.SchoolOfStudyService.get_school_spatial_data")
     def test_get_school_of_study_data_rate_limiting(
         self, mock_get_spatial_data, mock_client
@@ -286,12 +280,6 @@ class TestSchoolOfStudyDataEndpoint:
         ]
         mock_get_spatial_data.return_value = mock_features
 
-        # Reset rate limiter
-        from app.main import app
-
-        if hasattr(app.state, "limiter"):
-            app.state.limiter.reset()
-
         # Make 30 requests (should all succeed)
         for i in range(30):
             response = mock_client.get("/school_of_study_data/ETMS")
@@ -430,3 +418,39 @@ class TestSchoolOfStudyDataEndpoint:
             ]
             for prop in required_props:
                 assert prop in props
+
+    @patch("app.main.SchoolOfStudyService.get_school_twkb_features")
+    @patch("app.main.SchoolOfStudyService.supports_twkb", return_value=True)
+    def test_get_school_of_study_data_twkb_format(
+        self, mock_supports_twkb, mock_get_twkb, mock_client
+    ):
+        """Test that format=twkb returns the binary TWKB encoding."""
+        from app.twkb import decode_twkb_features
+
+        mock_get_twkb.return_value = [
+            {
+                "type": "Feature",
+                "geometry": b"\x01\x00\x02\x04",
+                "properties": {"geoid": "48113020100", "category": "ETMS"},
+            }
+        ]
+
+        response = mock_client.get("/school_of_study_data/ETMS?format=twkb")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.twkb"
+        features = decode_twkb_features(response.content)
+        assert features == mock_get_twkb.return_value
+        mock_get_twkb.assert_called_once_with("ETMS")
+
+    @patch("app.main.SchoolOfStudyService.get_school_twkb_features")
+    @patch("app.main.SchoolOfStudyService.supports_twkb", return_value=False)
+    def test_get_school_of_study_data_twkb_without_postgis(
+        self, mock_supports_twkb, mock_get_twkb, mock_client
+    ):
+        """Test that format=twkb is rejected when the database lacks PostGIS."""
+        response = mock_client.get("/school_of_study_data/ETMS?format=twkb")
+
+        assert response.status_code == 501
+        assert response.json()["detail"] == "TWKB output requires a PostGIS database"
+        mock_get_twkb.assert_not_called()
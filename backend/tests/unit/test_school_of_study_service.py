@@ -1,5 +1,6 @@
 """Unit tests for SchoolOfStudyService in app/services.py."""
 
+import pytest
 from unittest.mock import MagicMock
 from sqlalchemy.orm import Session
 
@@ -66,6 +67,15 @@ class TestSchoolOfStudyService:
             assert isinstance(value, str)
             assert len(value) > 0
 
+    def test_get_school_name_mappings_is_read_only(self):
+        """Test that callers cannot mutate the shared school name mappings."""
+        mappings = SchoolOfStudyService.get_school_name_mappings()
+
+        with pytest.raises(TypeError):
+            mappings["NEW"] = "New School"  # type: ignore[index]
+
+        assert mappings is SchoolOfStudyService.get_school_name_mappings()
+
     def test_get_school_spatial_data(self):
         """Test getting spatial data for a specific school category."""
         # Mock session
@@ -227,3 +237,18 @@ class TestSchoolOfStudyService:
         assert feature.properties.openings_2024_zscore is None
         assert feature.properties.jobs_2024_zscore is None
         assert feature.properties.openings_2024_zscore_color is None
+
+    @pytest.mark.parametrize("testing, expected", [("1", False), ("0", True)])
+    def test_supports_twkb(self, monkeypatch, testing, expected):
+        """Test that TWKB output is only offered on PostGIS databases."""
+        monkeypatch.setenv("TESTING", testing)
+
+        assert SchoolOfStudyService.supports_twkb() is expected
+
+    def test_get_school_twkb_features_without_postgis(self, monkeypatch):
+        """Test that the SQLite repository path refuses TWKB output."""
+        monkeypatch.setenv("TESTING", "1")
+        service = SchoolOfStudyService(MagicMock(spec=Session))
+
+        with pytest.raises(ValueError, match="requires PostGIS"):
+            service.get_school_twkb_features("ETMS")
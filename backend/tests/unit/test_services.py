@@ -9,6 +9,7 @@ Test coverage includes:
 - OccupationService.get_occupation_ids() with various data scenarios
 - SpatialService.get_geojson_features() with geometry handling and conversions
 - IsochroneService.get_isochrones_by_geoid() with travel time bands and color mapping
+- build_features() conversion of repository dicts into Pydantic features
 - Error handling for database exceptions
 - Edge cases like null values, empty results, and large datasets
 """
@@ -19,8 +20,18 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import json
 
-from app.services import OccupationService, SpatialService, IsochroneService
-from app.models import GeoJSONFeature, OccupationGeoJSONFeature, IsochroneFeature
+from app.services import (
+    OccupationService,
+    SpatialService,
+    IsochroneService,
+    build_features,
+)
+from app.models import (
+    GeoJSONFeature,
+    OccupationGeoJSONFeature,
+    IsochroneFeature,
+    IsochroneProperties,
+)
 from app.constants import TIME_CATEGORY_COLORS
 
 
@@ -1176,3 +1187,39 @@ class TestIsochroneService:
 
         assert TIME_CATEGORY_COLORS == expected_colors
         assert len(TIME_CATEGORY_COLORS) == 8
+
+
+class TestBuildFeatures:
+    """Test cases for the shared build_features helper"""
+
+    def test_build_features_converts_dicts_to_models(self):
+        """Test that repository dicts become typed feature models"""
+        polygon = {
+            "type": "Polygon",
+            "coordinates": [
+                [[-96.8, 32.7], [-96.7, 32.7], [-96.7, 32.8], [-96.8, 32.7]]
+            ],
+        }
+        features_data = [
+            {
+                "type": "Feature",
+                "geometry": polygon,
+                "properties": {
+                    "geoid": "48113020100",
+                    "time_category": "< 5",
+                    "color": "#1a9850",
+                },
+            }
+        ]
+
+        result = build_features(features_data, IsochroneFeature, IsochroneProperties)
+
+        assert len(result) == 1
+        assert isinstance(result[0], IsochroneFeature)
+        assert isinstance(result[0].properties, IsochroneProperties)
+        assert result[0].geometry == polygon
+        assert result[0].properties.time_category == "< 5"
+
+    def test_build_features_empty(self):
+        """Test that no repository rows produce no features"""
+        assert build_features([], IsochroneFeature, IsochroneProperties) == []
@@ -0,0 +1,84 @@
+"""
+Unit tests for the binary TWKB feature encoding in app/twkb.py.
+"""
+
+import struct
+
+from app.constants import TWKB_PRECISION
+from app.models import TTIClone
+from app.repositories.base import BaseRepository
+from app.twkb import decode_twkb_features, encode_twkb_features
+
+
+def _feature(geoid, geometry):
+    return {
+        "type": "Feature",
+        "geometry": geometry,
+        "properties": {"geoid": geoid, "category": "BHGT"},
+    }
+
+
+class TestTWKBEncoding:
+    """Test encoding and decoding of TWKB feature payloads."""
+
+    def test_round_trip_preserves_features(self):
+        """Test that decoding an encoded payload returns the original features."""
+        features = [
+            _feature("12345", b"\x01\x00\x02\x04"),
+            _feature("67890", b"\x01\x00\x06\x08"),
+        ]
+
+        assert decode_twkb_features(encode_twkb_features(features)) == features
+
+    def test_missing_geometry_encoded_as_empty(self):
+        """Test that features without geometry survive the round trip as None."""
+        features = [_feature("12345", None)]
+
+        payload = encode_twkb_features(features)
+
+        assert payload.endswith(struct.pack(">I", 0))
+        assert decode_twkb_features(payload)[0]["geometry"] is None
+
+    def test_header_holds_properties(self):
+        """Test that the payload starts with a length-prefixed properties header."""
+        payload = encode_twkb_features([_feature("12345", b"\x01")])
+
+        (header_length,) = struct.unpack_from(">I", payload, 0)
+        header = payload[4 : 4 + header_length]
+        assert header == b'[{"geoid":"12345","category":"BHGT"}]'
+
+    def test_empty_collection(self):
+        """Test encoding an empty feature list."""
+        payload = encode_twkb_features([])
+
+        assert decode_twkb_features(payload) == []
+
+
+class TestTWKBGeometrySelection:
+    """Test selecting and decoding geometries as TWKB in the repositories."""
+
+    def test_geometry_expression_selects_twkb(self):
+        """Test that as_twkb selects ST_AsTWKB at the configured precision."""
+        expression = BaseRepository.geometry_expression(TTIClone.geom, as_twkb=True)
+
+        sql = str(expression.compile(compile_kwargs={"literal_binds": True}))
+        assert sql == f"ST_AsTWKB(tti_clone.geom, {TWKB_PRECISION})"
+
+    def test_geometry_expression_defaults_to_geojson(self):
+        """Test that geometries are selected as GeoJSON text by default."""
+        expression = BaseRepository.geometry_expression(TTIClone.geom)
+
+        assert str(expression.compile()) == "ST_AsGeoJSON(tti_clone.geom)"
+
+    def test_decode_geometry_returns_bytes(self):
+        """Test that TWKB values come back as bytes, whatever buffer type held them."""
+        geometry = BaseRepository.decode_geometry(
+            memoryview(b"\x01\x00\x02\x04"), as_twkb=True
+        )
+
+        assert geometry == b"\x01\x00\x02\x04"
+        assert isinstance(geometry, bytes)
+
+    def test_decode_geometry_missing(self):
+        """Test that a missing TWKB geometry decodes to None."""
+        assert BaseRepository.decode_geometry(None, as_twkb=True) is None